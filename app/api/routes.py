@@ -1,14 +1,18 @@
 """API route definitions with enhanced endpoints."""
 
+import sys
 import time
-import uuid
-from datetime import datetime, timezone
 from typing import Any, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from sqlalchemy import distinct, func, select, text
+import numpy as np
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST
+from sqlalchemy import case, distinct, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.middleware import metrics_collector
 from app.db.models import DataSource, ETLJob, ETLStatus, UnifiedCryptoData
 from app.db.session import get_db
 from app.ingestion.service import etl_service
@@ -19,32 +23,52 @@ from app.schemas.crypto import (
     ETLJobSchema,
     ETLStats,
     HealthResponse,
+    Pagination,
     ResponseMetadata,
     StatsResponse,
     SymbolStats,
     UnifiedCryptoDataSchema,
+    next_request_id,
+)
+from app.schemas.crypto_out import (
+    DataResponseOut,
+    ResponseMetadataOut,
+    UnifiedCryptoDataOut,
+    encode,
 )
 
 router = APIRouter()
 
+# Interned source names, keyed by value so both DataSource members and raw
+# DB strings resolve to the same object.
+_SOURCE_STRS: dict[str, str] = {s.value: sys.intern(s.value) for s in DataSource}
+_ALL_SOURCES: tuple[str, ...] = tuple(_SOURCE_STRS.values())
+
+
+def _source_names(sources: Any) -> tuple[str, ...]:
+    """Map aggregated source values (enums or strings) to interned names."""
+    if not sources:
+        return ()
+    return tuple(_SOURCE_STRS[getattr(s, "value", s)] for s in sources)
+
 
 # ============== GET /data - Enhanced with metadata ==============
 
 
-@router.get("/data", response_model=DataResponse)
+@router.get("/data", response_model=DataResponse, response_class=ORJSONResponse)
 async def get_data(
     symbol: Optional[str] = Query(None, description="Filter by symbol (e.g., BTC, ETH)"),
     source: Optional[DataSource] = Query(None, description="Filter by data source"),
     limit: int = Query(50, ge=1, le=500, description="Number of records to return"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
     db: AsyncSession = Depends(get_db),
-) -> DataResponse:
+) -> Any:
     """
     Retrieve cryptocurrency data with pagination and filtering.
     Returns data with metadata including request_id, total_records, and api_latency_ms.
     """
     start_time = time.perf_counter()
-    request_id = str(uuid.uuid4())
+    request_id = next_request_id()
 
     # Build query
     query = select(UnifiedCryptoData)
@@ -69,18 +93,26 @@ async def get_data(
 
     latency_ms = (time.perf_counter() - start_time) * 1000
 
+    if settings.fast_serialization:
+        body = DataResponseOut(
+            metadata=ResponseMetadataOut(
+                request_id=request_id,
+                total_records=total,
+                api_latency_ms=round(latency_ms, 2),
+            ),
+            data=[UnifiedCryptoDataOut.from_orm(item) for item in items],
+            pagination=Pagination(limit=limit, offset=offset, total=total),
+        )
+        return Response(content=encode(body), media_type="application/json")
+
     return DataResponse(
         metadata=ResponseMetadata(
             request_id=request_id,
             total_records=total,
             api_latency_ms=round(latency_ms, 2),
         ),
-        data=[UnifiedCryptoDataSchema.model_validate(item) for item in items],
-        pagination={
-            "limit": limit,
-            "offset": offset,
-            "total": total,
-        }
+        data=[UnifiedCryptoDataSchema.from_orm_trusted(item) for item in items],
+        pagination=Pagination(limit=limit, offset=offset, total=total),
     )
 
 
@@ -93,7 +125,7 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     Comprehensive health check for DB connection and ETL status.
     """
     start_time = time.perf_counter()
-    request_id = str(uuid.uuid4())
+    request_id = next_request_id()
 
     # Check DB connection
     db_connected = False
@@ -135,7 +167,6 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
 
     return HealthResponse(
         status=overall_status,
-        timestamp=datetime.now(timezone.utc),
         database=db_status,
         etl=etl_status,
         metadata=ResponseMetadata(
@@ -149,13 +180,13 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
 # ============== GET /stats - Aggregations and statistics ==============
 
 
-@router.get("/stats", response_model=StatsResponse)
+@router.get("/stats", response_model=StatsResponse, response_class=ORJSONResponse)
 async def get_stats(db: AsyncSession = Depends(get_db)) -> StatsResponse:
     """
     Get statistical summary of the crypto data.
     """
     start_time = time.perf_counter()
-    request_id = str(uuid.uuid4())
+    request_id = next_request_id()
 
     # Total records
     total_query = select(func.count()).select_from(UnifiedCryptoData)
@@ -196,11 +227,9 @@ async def get_stats(db: AsyncSession = Depends(get_db)) -> StatsResponse:
 
     symbol_stats = []
     for row in stats_result:
-        sources = getattr(row, 'sources', None) or [s.value for s in DataSource]
-        sources_list = (
-            sources if isinstance(sources, list)
-            else [str(s) for s in sources] if sources else []
-        )
+        # SQLite fallback has no per-symbol sources column
+        sources = getattr(row, 'sources', None)
+        sources_tuple = _source_names(sources) if sources else _ALL_SOURCES
         symbol_stats.append(
             SymbolStats(
                 symbol=row.symbol,
@@ -208,34 +237,30 @@ async def get_stats(db: AsyncSession = Depends(get_db)) -> StatsResponse:
                 avg_price_usd=float(row.avg_price) if row.avg_price else 0.0,
                 max_price_usd=float(row.max_price) if row.max_price else 0.0,
                 min_price_usd=float(row.min_price) if row.min_price else 0.0,
-                sources=sources_list,
+                sources=sources_tuple,
             )
         )
 
-    # ETL job stats
-    etl_jobs_query = select(ETLJob)
-    etl_jobs_result = await db.execute(etl_jobs_query)
-    etl_jobs = etl_jobs_result.scalars().all()
-
-    total_jobs = len(etl_jobs)
-    successful_jobs = sum(1 for j in etl_jobs if j.status == ETLStatus.SUCCESS)
-    failed_jobs = sum(1 for j in etl_jobs if j.status == ETLStatus.FAILURE)
-    total_records_processed = sum(j.records_processed or 0 for j in etl_jobs)
-
-    # Get last success/failure timestamps
-    success_jobs = [
-        j.completed_at for j in etl_jobs
-        if j.status == ETLStatus.SUCCESS and j.completed_at
-    ]
-    failure_jobs = [
-        j.completed_at for j in etl_jobs
-        if j.status == ETLStatus.FAILURE and j.completed_at
-    ]
-    last_success = max(success_jobs, default=None)
-    last_failure = max(failure_jobs, default=None)
+    # ETL job stats, aggregated in the database
+    is_success = ETLJob.status == ETLStatus.SUCCESS
+    is_failure = ETLJob.status == ETLStatus.FAILURE
+    etl_agg_query = select(
+        func.count(ETLJob.id).label("total_jobs"),
+        func.count(case((is_success, 1))).label("successful_jobs"),
+        func.count(case((is_failure, 1))).label("failed_jobs"),
+        func.coalesce(func.sum(ETLJob.records_processed), 0).label("records_processed"),
+        func.max(case((is_success, ETLJob.completed_at))).label("last_success"),
+        func.max(case((is_failure, ETLJob.completed_at))).label("last_failure"),
+    )
+    etl_agg = (await db.execute(etl_agg_query)).one()
 
     # Get last job duration
-    last_job = max(etl_jobs, key=lambda j: j.started_at, default=None) if etl_jobs else None
+    last_job_query = (
+        select(ETLJob.started_at, ETLJob.completed_at)
+        .order_by(ETLJob.started_at.desc())
+        .limit(1)
+    )
+    last_job = (await db.execute(last_job_query)).first()
     last_job_duration = None
     if last_job and last_job.completed_at and last_job.started_at:
         last_job_duration = (last_job.completed_at - last_job.started_at).total_seconds()
@@ -254,15 +279,15 @@ async def get_stats(db: AsyncSession = Depends(get_db)) -> StatsResponse:
         ),
         total_records=total,
         unique_symbols=unique_symbols,
-        sources_active=[s.value for s in DataSource],
+        sources_active=_ALL_SOURCES,
         etl_stats=ETLStats(
-            total_jobs=total_jobs,
-            successful_jobs=successful_jobs,
-            failed_jobs=failed_jobs,
-            last_success_at=last_success,
-            last_failure_at=last_failure,
+            total_jobs=etl_agg.total_jobs,
+            successful_jobs=etl_agg.successful_jobs,
+            failed_jobs=etl_agg.failed_jobs,
+            last_success_at=etl_agg.last_success,
+            last_failure_at=etl_agg.last_failure,
             last_job_duration_seconds=last_job_duration,
-            total_records_processed=total_records_processed,
+            total_records_processed=etl_agg.records_processed,
         ),
         symbol_stats=symbol_stats,
         data_freshness=data_freshness,
@@ -277,11 +302,7 @@ async def get_metrics():
     """
     Expose Prometheus metrics.
     """
-    from fastapi.responses import PlainTextResponse
-
-    from app.core.middleware import metrics_collector
-    content = metrics_collector.get_prometheus_output()
-    return PlainTextResponse(content=content, media_type="text/plain")
+    return Response(content=metrics_collector.render(), media_type=CONTENT_TYPE_LATEST)
 
 
 # ============== GET /runs - ETL Run History with Anomaly Detection (P2.6) ==============
@@ -318,65 +339,48 @@ async def get_runs(
     if not jobs:
         return {"runs": [], "anomalies": [], "statistics": {}}
 
-    # Calculate statistics for anomaly detection
-    durations = []
-    record_counts = []
-    success_count = 0
-    failure_count = 0
-
-    for job in jobs:
-        if job.completed_at and job.started_at:
-            duration = (job.completed_at - job.started_at).total_seconds()
-            durations.append(duration)
-        if job.records_processed is not None:
-            record_counts.append(job.records_processed)
-        if job.status == ETLStatus.SUCCESS:
-            success_count += 1
-        elif job.status == ETLStatus.FAILURE:
-            failure_count += 1
-
-    # Calculate mean and std dev for anomaly detection
-    import statistics
+    # Columnar views of the runs for vectorized anomaly detection
+    timed = [job for job in jobs if job.completed_at and job.started_at]
+    durations = np.fromiter(
+        ((job.completed_at - job.started_at).total_seconds() for job in timed),
+        dtype=np.float64,
+        count=len(timed),
+    )
+    counted = [job for job in jobs if job.records_processed is not None]
+    record_counts = np.fromiter(
+        (job.records_processed for job in counted), dtype=np.int64, count=len(counted)
+    )
+    # Compare on the enum values: NumPy does not treat str-enum members as
+    # their values when broadcasting
+    statuses = np.array([job.status.value for job in jobs])
+    success_count = int((statuses == ETLStatus.SUCCESS.value).sum())
+    failure_count = int((statuses == ETLStatus.FAILURE.value).sum())
+
     anomalies = []
 
     if len(durations) >= 3:
-        mean_duration = statistics.mean(durations)
-        std_duration = statistics.stdev(durations) if len(durations) > 1 else 0
-
         # Check for duration anomalies (>2 std devs)
-        for job in jobs:
-            if job.completed_at and job.started_at:
-                duration = (job.completed_at - job.started_at).total_seconds()
-                if std_duration > 0 and abs(duration - mean_duration) > 2 * std_duration:
-                    z_score = (duration - mean_duration) / std_duration if std_duration else 0
-                    lower = mean_duration - 2 * std_duration
-                    upper = mean_duration + 2 * std_duration
-                    anomalies.append({
-                        "job_id": job.id,
-                        "type": "duration_outlier",
-                        "value": duration,
-                        "expected_range": f"{lower:.1f} - {upper:.1f}",
-                        "z_score": z_score,
-                    })
+        idx, z_scores, lower, upper = _zscore_outliers(durations)
+        for i, z_score in zip(idx.tolist(), z_scores.tolist()):
+            anomalies.append({
+                "job_id": timed[i].id,
+                "type": "duration_outlier",
+                "value": float(durations[i]),
+                "expected_range": f"{lower:.1f} - {upper:.1f}",
+                "z_score": z_score,
+            })
 
     if len(record_counts) >= 3:
-        mean_records = statistics.mean(record_counts)
-        std_records = statistics.stdev(record_counts) if len(record_counts) > 1 else 0
-
         # Check for record count anomalies
-        for job in jobs:
-            if job.records_processed is not None and std_records > 0:
-                if abs(job.records_processed - mean_records) > 2 * std_records:
-                    z_score = (job.records_processed - mean_records) / std_records
-                    lower = max(0, mean_records - 2 * std_records)
-                    upper = mean_records + 2 * std_records
-                    anomalies.append({
-                        "job_id": job.id,
-                        "type": "record_count_outlier",
-                        "value": job.records_processed,
-                        "expected_range": f"{lower:.0f} - {upper:.0f}",
-                        "z_score": z_score,
-                    })
+        idx, z_scores, lower, upper = _zscore_outliers(record_counts)
+        for i, z_score in zip(idx.tolist(), z_scores.tolist()):
+            anomalies.append({
+                "job_id": counted[i].id,
+                "type": "record_count_outlier",
+                "value": int(record_counts[i]),
+                "expected_range": f"{max(0, lower):.0f} - {upper:.0f}",
+                "z_score": z_score,
+            })
 
     # Check for failure rate spike
     total_jobs = success_count + failure_count
@@ -398,12 +402,32 @@ async def get_runs(
             "success_count": success_count,
             "failure_count": failure_count,
             "success_rate": success_count / total_jobs if total_jobs > 0 else 0,
-            "avg_duration_seconds": statistics.mean(durations) if durations else None,
-            "avg_records_processed": statistics.mean(record_counts) if record_counts else None,
+            "avg_duration_seconds": float(durations.mean()) if len(durations) else None,
+            "avg_records_processed": (
+                float(record_counts.mean()) if len(record_counts) else None
+            ),
         },
     }
 
 
+def _zscore_outliers(
+    values: np.ndarray, max_z: float = 2.0
+) -> tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Flag values more than ``max_z`` sample standard deviations from the mean.
+
+    Returns (outlier indices, their z-scores, lower bound, upper bound).
+    """
+    mean = float(values.mean())
+    std = float(values.std(ddof=1))
+    lower, upper = mean - max_z * std, mean + max_z * std
+    if std == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0), lower, upper
+    z_scores = (values - mean) / std
+    idx = np.flatnonzero(np.abs(z_scores) > max_z)
+    return idx, z_scores[idx], lower, upper
+
+
 # ============== GET /runs/compare - Compare ETL Runs (P2.6) ==============
 
 
@@ -1,6 +1,5 @@
 """Application configuration using pydantic-settings."""
 
-from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field, model_validator
@@ -32,6 +31,9 @@ class Settings(BaseSettings):
     debug: bool = False
     log_level: str = "INFO"
 
+    # API
+    fast_serialization: bool = False  # Encode /data with msgspec structs
+
     # ETL
     batch_size: int = 100
     csv_data_path: str = "data/crypto_data.csv"
@@ -50,10 +52,22 @@ class Settings(BaseSettings):
         return self
 
 
-@lru_cache
+settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Shared settings instance, built once at import."""
+    return settings
+
 
+def reload_settings() -> Settings:
+    """
+    Rebuild settings from the current environment.
 
-settings = get_settings()
+    Modules that did ``from app.core.config import settings`` keep the
+    previous instance; call sites that need the new values should go
+    through ``get_settings()``.
+    """
+    global settings
+    settings = Settings()
+    return settings
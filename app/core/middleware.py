@@ -4,9 +4,12 @@ import json
 import logging
 import time
 import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from typing import Any, Callable
 
 from fastapi import Request, Response
+from prometheus_client import CollectorRegistry, Counter, Gauge, generate_latest
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
@@ -52,6 +55,15 @@ def get_structured_logger(name: str = "kasparro.request") -> StructuredLogger:
 
 request_logger = get_structured_logger()
 
+# Wall-clock time the current request entered the app; set once per request
+# so every "now" default in a response agrees.
+request_time: ContextVar[datetime] = ContextVar("request_time")
+
+
+def current_request_time() -> datetime:
+    """Return the current request's start time, or now outside a request."""
+    return request_time.get(None) or datetime.now(timezone.utc)
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
@@ -81,6 +93,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         # Store request_id in request state for downstream use
         request.state.request_id = request_id
+        request_time.set(datetime.now(timezone.utc))
 
         # Record start time
         start_time = time.perf_counter()
@@ -142,7 +155,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
 class MetricsCollector:
     """
-    Simple in-memory metrics collector for Prometheus-style output.
+    Prometheus metrics backed by a private prometheus_client registry.
 
     Tracks:
     - http_requests_total: Counter by method/status
@@ -151,57 +164,45 @@ class MetricsCollector:
     """
 
     def __init__(self):
-        self._http_requests: dict[tuple[str, int], int] = {}
-        self._etl_runs: dict[tuple[str, str], int] = {}
-        self._etl_last_duration: dict[str, float] = {}
+        self.registry = CollectorRegistry(auto_describe=True)
+        self._http_requests = Counter(
+            "http_requests_total",
+            "Total number of HTTP requests",
+            ["method", "status"],
+            registry=self.registry,
+        )
+        self._etl_runs = Counter(
+            "etl_runs_total",
+            "Total number of ETL runs",
+            ["source", "status"],
+            registry=self.registry,
+        )
+        self._etl_last_duration = Gauge(
+            "etl_last_duration_seconds",
+            "Duration of last ETL run in seconds",
+            ["source"],
+            registry=self.registry,
+        )
 
     def increment_http_request(self, method: str, status_code: int) -> None:
         """Increment HTTP request counter."""
-        key = (method, status_code)
-        self._http_requests[key] = self._http_requests.get(key, 0) + 1
+        self._http_requests.labels(method, str(status_code)).inc()
 
     def increment_etl_run(self, source: str, status: str) -> None:
         """Increment ETL run counter."""
-        key = (source, status)
-        self._etl_runs[key] = self._etl_runs.get(key, 0) + 1
+        self._etl_runs.labels(source, status).inc()
 
     def set_etl_duration(self, source: str, duration_seconds: float) -> None:
         """Set last ETL duration for a source."""
-        self._etl_last_duration[source] = duration_seconds
+        self._etl_last_duration.labels(source).set(duration_seconds)
+
+    def render(self) -> bytes:
+        """Encode the registry in the Prometheus text exposition format."""
+        return generate_latest(self.registry)
 
     def get_prometheus_output(self) -> str:
         """Generate Prometheus-compatible metrics output."""
-        lines = []
-
-        # HTTP requests total
-        lines.append("# HELP http_requests_total Total number of HTTP requests")
-        lines.append("# TYPE http_requests_total counter")
-        for (method, status), count in sorted(self._http_requests.items()):
-            lines.append(
-                f'http_requests_total{{method="{method}",status="{status}"}} {count}'
-            )
-
-        lines.append("")
-
-        # ETL runs total
-        lines.append("# HELP etl_runs_total Total number of ETL runs")
-        lines.append("# TYPE etl_runs_total counter")
-        for (source, status), count in sorted(self._etl_runs.items()):
-            lines.append(
-                f'etl_runs_total{{source="{source}",status="{status}"}} {count}'
-            )
-
-        lines.append("")
-
-        # ETL last duration
-        lines.append("# HELP etl_last_duration_seconds Duration of last ETL run in seconds")
-        lines.append("# TYPE etl_last_duration_seconds gauge")
-        for source, duration in sorted(self._etl_last_duration.items()):
-            lines.append(
-                f'etl_last_duration_seconds{{source="{source}"}} {duration:.3f}'
-            )
-
-        return "\n".join(lines)
+        return self.render().decode("utf-8")
 
 
 # Global metrics collector instance
@@ -1,8 +1,10 @@
 """Database session management with async SQLAlchemy."""
 
+import json
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -11,6 +13,19 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.config import settings
 
+
+def orjson_dumps(value: Any) -> str:
+    """JSON column serializer; orjson is several times faster than stdlib json.
+
+    orjson rejects integers beyond 64 bits, which raw API payloads can carry
+    (e.g. token supplies in base units); those payloads go through stdlib json.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(value)
+
+
 # Ensure db_url is set, use a default for testing if not
 _db_url = settings.db_url or "sqlite+aiosqlite:///./test.db"
 
@@ -19,6 +34,8 @@ engine = create_async_engine(
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     echo=settings.debug,
+    json_serializer=orjson_dumps,
+    json_deserializer=orjson.loads,
 )
 
 async_session_factory = async_sessionmaker(
@@ -15,9 +15,10 @@ Architecture:
               SourceAssetMapping
 """
 
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import logger
@@ -106,7 +107,7 @@ class AssetResolver:
 
         if existing_coin:
             # Create new mapping for this source to existing coin
-            await self._create_mapping(
+            coin_id = await self._create_mapping(
                 session,
                 coin_id=existing_coin.id,
                 source=source,
@@ -114,13 +115,13 @@ class AssetResolver:
                 source_symbol=source_symbol,
                 source_name=source_name,
             )
-            self._mapping_cache[cache_key] = existing_coin.id
-            self._symbol_cache[normalized_symbol] = existing_coin.id
+            self._mapping_cache[cache_key] = coin_id
+            self._symbol_cache[normalized_symbol] = coin_id
             logger.info(
                 f"Linked {source.value}:{source_id} to existing Coin "
-                f"{existing_coin.symbol} (id={existing_coin.id})"
+                f"{existing_coin.symbol} (id={coin_id})"
             )
-            return existing_coin.id
+            return coin_id
 
         # 4. Create new Coin and mapping (asset not yet in system)
         coin_id = await self._create_coin_with_mapping(
@@ -136,6 +137,120 @@ class AssetResolver:
         self._symbol_cache[normalized_symbol] = coin_id
         return coin_id
 
+    async def resolve_assets(
+        self,
+        session: AsyncSession,
+        assets: Sequence[Mapping[str, Any]],
+    ) -> list[int]:
+        """
+        Resolve many source assets to canonical Coin IDs in bulk.
+
+        Each item carries the ``resolve_asset`` keyword arguments (``source``,
+        ``source_id``, ``source_symbol`` and optionally ``source_name``). The
+        result matches calling ``resolve_asset`` for each item in order, but
+        cache misses cost at most four statements in total: one mapping
+        lookup, one symbol lookup, one Coin insert and one mapping insert.
+
+        Args:
+            session: Database session
+            assets: Assets to resolve
+
+        Returns:
+            Canonical coin_id for each asset, in input order
+        """
+        keys = [(asset["source"], asset["source_id"]) for asset in assets]
+        # First occurrence of each uncached key, in input order
+        pending: dict[tuple[DataSource, str], Mapping[str, Any]] = {}
+        for key, asset in zip(keys, assets):
+            if key not in self._mapping_cache:
+                pending.setdefault(key, asset)
+
+        if pending:
+            # 1. Existing mappings for all uncached keys
+            mapping_result = await session.execute(
+                select(
+                    SourceAssetMapping.source,
+                    SourceAssetMapping.source_id,
+                    SourceAssetMapping.coin_id,
+                ).where(
+                    tuple_(SourceAssetMapping.source, SourceAssetMapping.source_id).in_(
+                        list(pending)
+                    )
+                )
+            )
+            for source, source_id, coin_id in mapping_result:
+                self._mapping_cache[(source, source_id)] = coin_id
+                pending.pop((source, source_id), None)
+
+        if pending:
+            await self._resolve_unmapped(session, pending)
+
+        return [self._mapping_cache[key] for key in keys]
+
+    async def _resolve_unmapped(
+        self,
+        session: AsyncSession,
+        pending: dict[tuple[DataSource, str], Mapping[str, Any]],
+    ) -> None:
+        """Link or create Coins for keys that have no mapping yet."""
+        symbols = {
+            key: asset["source_symbol"].upper().strip() for key, asset in pending.items()
+        }
+
+        # 2. Existing Coins by symbol (lowest id wins, as for a single lookup)
+        coin_result = await session.execute(
+            select(Coin.symbol, Coin.id)
+            .where(Coin.symbol.in_(set(symbols.values())))
+            .order_by(Coin.id)
+        )
+        coin_by_symbol: dict[str, int] = {}
+        for symbol, coin_id in coin_result:
+            coin_by_symbol.setdefault(symbol, coin_id)
+
+        # 3. New Coins, named after the first asset seen with each symbol
+        new_coins: dict[str, dict[str, str]] = {}
+        mapping_names: dict[tuple[DataSource, str], Optional[str]] = {}
+        for key, asset in pending.items():
+            symbol = symbols[key]
+            mapping_names[key] = asset.get("source_name")
+            if symbol not in coin_by_symbol and symbol not in new_coins:
+                name = asset.get("source_name") or symbol
+                new_coins[symbol] = {
+                    "symbol": symbol,
+                    "name": name,
+                    "slug": self._generate_slug(symbol, name),
+                }
+                # The creating mapping carries the Coin name, as in resolve_asset
+                mapping_names[key] = name
+        if new_coins:
+            created = await session.execute(
+                insert(Coin).returning(Coin.symbol, Coin.id),
+                list(new_coins.values()),
+            )
+            for symbol, coin_id in created:
+                coin_by_symbol[symbol] = coin_id
+            logger.info(f"Created {len(new_coins)} new Coins: {sorted(new_coins)}")
+
+        # 4. One mapping per pending key
+        await session.execute(
+            insert(SourceAssetMapping),
+            [
+                {
+                    "coin_id": coin_by_symbol[symbols[key]],
+                    "source": key[0],
+                    "source_id": key[1],
+                    "source_symbol": asset["source_symbol"],
+                    "source_name": mapping_names[key],
+                }
+                for key, asset in pending.items()
+            ],
+        )
+
+        for key in pending:
+            coin_id = coin_by_symbol[symbols[key]]
+            self._mapping_cache[key] = coin_id
+            self._symbol_cache[symbols[key]] = coin_id
+
     async def resolve_by_symbol(
         self,
         session: AsyncSession,
@@ -241,7 +356,7 @@ class AssetResolver:
         await session.flush()  # Get the coin.id
 
         # Create mapping
-        await self._create_mapping(
+        coin_id = await self._create_mapping(
             session,
             coin_id=coin.id,
             source=source,
@@ -251,7 +366,7 @@ class AssetResolver:
         )
 
         logger.info(f"Created new Coin: {symbol} (id={coin.id}) from {source.value}:{source_id}")
-        return coin.id
+        return coin_id
 
     async def _create_mapping(
         self,
@@ -261,28 +376,32 @@ class AssetResolver:
         source_id: str,
         source_symbol: str,
         source_name: Optional[str] = None,
-    ) -> None:
-        """Create a source-to-coin mapping."""
-        # Check if mapping already exists
-        existing_query = select(SourceAssetMapping).where(
-            SourceAssetMapping.source == source,
-            SourceAssetMapping.source_id == source_id,
-        )
-        result = await session.execute(existing_query)
-        if result.scalar_one_or_none():
-            return  # Mapping already exists
+    ) -> int:
+        """
+        Create a source-to-coin mapping, keeping any mapping already stored.
+
+        A single INSERT ... ON CONFLICT (source, source_id) upsert replaces a
+        SELECT-then-INSERT, so a concurrent writer cannot slip in between.
+        The no-op update makes RETURNING yield the stored row on conflict.
 
-        mapping = SourceAssetMapping(
+        Returns:
+            coin_id the (source, source_id) key is mapped to
+        """
+        stmt = pg_insert(SourceAssetMapping).values(
             coin_id=coin_id,
             source=source,
             source_id=source_id,
             source_symbol=source_symbol,
             source_name=source_name,
         )
-        session.add(mapping)
-        await session.flush()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["source", "source_id"],
+            set_={"source_id": stmt.excluded.source_id},
+        ).returning(SourceAssetMapping.coin_id)
+        mapped_coin_id = await session.scalar(stmt)
 
-        logger.debug(f"Created mapping: {source.value}:{source_id} -> coin_id={coin_id}")
+        logger.debug(f"Mapped {source.value}:{source_id} -> coin_id={mapped_coin_id}")
+        return mapped_coin_id
 
     async def _ensure_mapping_exists(
         self,
@@ -297,7 +416,7 @@ class AssetResolver:
         if cache_key in self._mapping_cache:
             return
 
-        await self._create_mapping(
+        self._mapping_cache[cache_key] = await self._create_mapping(
             session,
             coin_id=coin_id,
             source=source,
@@ -305,8 +424,6 @@ class AssetResolver:
             source_symbol=source_symbol,
         )
 
-        self._mapping_cache[cache_key] = coin_id
-
     def _generate_slug(self, symbol: str, name: str) -> str:
         """Generate a unique slug for a coin."""
         # Use lowercase symbol as primary slug
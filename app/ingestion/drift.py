@@ -1,14 +1,20 @@
-import difflib
 import logging
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
+from rapidfuzz import fuzz, process
 
 logger = logging.getLogger(__name__)
 
+# Distinct observed schemas whose rename matches are kept per detector
+_RENAME_CACHE_SIZE = 128
+
 
 class DriftSeverity(str, Enum):
     """Severity levels for drift detection."""
@@ -17,7 +23,7 @@ class DriftSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftResult:
     """Result of a drift detection check."""
     drift_type: str
@@ -53,32 +59,46 @@ class DriftDetector:
         self.expected_columns = expected_columns
         self.null_threshold = null_threshold  # 10% nulls allowed
         self.fuzzy_match_threshold = fuzzy_match_threshold
-        self._drift_history: list[DriftResult] = []
+        # Drift history as parallel columns: the summary only needs types,
+        # severities and the latest timestamp, not the result objects
+        self._history_types: list[str] = []
+        self._history_severities: list[str] = []
+        self._latest_drift: Optional[datetime] = None
+        # Built once: exact lookups and lower-cased name -> expected column
+        self._expected_set = frozenset(expected_columns)
+        self._expected_by_lower = {col.lower(): col for col in expected_columns}
+        # (observed columns, threshold) -> rename matches, in LRU order
+        self._rename_cache: dict[
+            tuple[frozenset[str], float], dict[str, tuple[str, float]]
+        ] = {}
 
     def check_schema(self, df: pd.DataFrame) -> list[DriftResult]:
         """
         Check for schema drift with fuzzy column matching.
 
+        Returns list of DriftResult for each issue found.
+        """
+        return self.check_schema_columns(df.columns)
+
+    def check_schema_columns(self, columns: Iterable[str]) -> list[DriftResult]:
+        """
+        Check column names for schema drift without building a DataFrame.
+
         Returns list of DriftResult for each issue found.
         """
         results: list[DriftResult] = []
-        actual_columns = set(df.columns)
-        expected_set = set(self.expected_columns)
+        actual_columns = set(columns)
+        expected_set = self._expected_set
 
         # Find missing columns
-        missing = expected_set - actual_columns
+        missing = [col for col in self.expected_columns if col not in actual_columns]
 
-        for col in missing:
-            # Try fuzzy matching against actual columns
-            matches = difflib.get_close_matches(
-                col, actual_columns, n=1, cutoff=self.fuzzy_match_threshold
-            )
+        matches = self._rename_matches(actual_columns, missing) if missing else {}
 
-            if matches:
+        for col in missing:
+            if col in matches:
                 # Column might have been renamed
-                best_match = matches[0]
-                # Calculate confidence score
-                confidence = difflib.SequenceMatcher(None, col, best_match).ratio()
+                best_match, confidence = matches[col]
 
                 result = DriftResult(
                     drift_type="schema_rename",
@@ -124,9 +144,57 @@ class DriftDetector:
             results.append(result)
             logger.info(f"Schema Change: New columns detected - {extra}")
 
-        self._drift_history.extend(results)
+        self._record(results)
         return results
 
+    def _rename_matches(
+        self, actual_columns: set[str], missing: list[str]
+    ) -> dict[str, tuple[str, float]]:
+        """
+        Map missing expected columns to (likely renamed column, confidence).
+
+        Results depend only on the observed column set and the threshold, so
+        they are memoized; DriftResults are still built fresh per call.
+        """
+        key = (frozenset(actual_columns), self.fuzzy_match_threshold)
+        cached = self._rename_cache.pop(key, None)
+        if cached is not None:
+            # Re-insert to mark as most recently used
+            self._rename_cache[key] = cached
+            return cached
+
+        # Case-only renames resolve through the index without fuzzy scoring
+        matches: dict[str, tuple[str, float]] = {}
+        missing_set = set(missing)
+        for col in actual_columns - self._expected_set:
+            expected = self._expected_by_lower.get(str(col).lower())
+            if expected in missing_set and expected not in matches:
+                matches[expected] = (str(col), 1.0)
+
+        # Score the remaining missing columns against every actual column in
+        # one RapidFuzz call; scores below the cutoff come back as 0
+        unmatched = [col for col in missing if col not in matches]
+        candidates = [str(col) for col in actual_columns]
+        if unmatched and candidates:
+            scores = process.cdist(
+                unmatched,
+                candidates,
+                scorer=fuzz.ratio,
+                score_cutoff=self.fuzzy_match_threshold * 100,
+            )
+            best_idx = scores.argmax(axis=1)
+            best_scores = scores.max(axis=1)
+            for i, col in enumerate(unmatched):
+                if best_scores[i] > 0:
+                    # Confidence score is the normalized similarity
+                    matches[col] = (candidates[best_idx[i]], float(best_scores[i]) / 100)
+
+        if len(self._rename_cache) >= _RENAME_CACHE_SIZE:
+            # Evict the least recently used schema
+            del self._rename_cache[next(iter(self._rename_cache))]
+        self._rename_cache[key] = matches
+        return matches
+
     def check_data_quality(self, df: pd.DataFrame) -> list[DriftResult]:
         """
         Check for data quality drift (null ratios).
@@ -134,10 +202,16 @@ class DriftDetector:
         Returns list of DriftResult for columns exceeding null threshold.
         """
         results: list[DriftResult] = []
-        null_ratios = df.isnull().mean()
-        drifted_cols = null_ratios[null_ratios > self.null_threshold]
-
-        for col, ratio in drifted_cols.items():
+        # One NumPy reduction over the (rows x cols) null mask; counts are
+        # reused for the per-column details
+        row_count = len(df)
+        null_counts = df.isna().to_numpy().sum(axis=0, dtype=np.int64)
+        null_ratios = null_counts / max(row_count, 1)
+        columns = df.columns.to_numpy()
+
+        for i in np.flatnonzero(null_ratios > self.null_threshold):
+            col = columns[i]
+            ratio = float(null_ratios[i])
             # Calculate severity based on null ratio
             if ratio > 0.5:
                 severity = DriftSeverity.CRITICAL
@@ -158,8 +232,8 @@ class DriftDetector:
                     "column": col,
                     "null_ratio": round(ratio, 4),
                     "threshold": self.null_threshold,
-                    "row_count": len(df),
-                    "null_count": int(df[col].isnull().sum()),
+                    "row_count": row_count,
+                    "null_count": int(null_counts[i]),
                 },
                 timestamp=datetime.now(timezone.utc),
             )
@@ -169,7 +243,7 @@ class DriftDetector:
                 f"(threshold: {self.null_threshold:.1%})"
             )
 
-        self._drift_history.extend(results)
+        self._record(results)
         return results
 
     def check_type_drift(
@@ -213,7 +287,7 @@ class DriftDetector:
                 results.append(result)
                 logger.warning(f"Type Drift: {msg}")
 
-        self._drift_history.extend(results)
+        self._record(results)
         return results
 
     def detect_drift(self, df: pd.DataFrame) -> tuple[bool, list[DriftResult]]:
@@ -245,30 +319,28 @@ class DriftDetector:
 
         return has_critical, all_results
 
+    def _record(self, results: list[DriftResult]) -> None:
+        """Append results to the drift history columns."""
+        if not results:
+            return
+        self._history_types.extend(r.drift_type for r in results)
+        self._history_severities.extend(r.severity.value for r in results)
+        self._latest_drift = results[-1].timestamp
+
     def get_drift_summary(self) -> dict[str, Any]:
         """Get summary of all drift detections."""
-        if not self._drift_history:
+        if not self._history_types:
             return {"total_issues": 0, "by_severity": {}, "by_type": {}}
 
-        by_severity: dict[str, int] = {}
-        by_type: dict[str, int] = {}
-
-        for result in self._drift_history:
-            by_severity[result.severity.value] = by_severity.get(result.severity.value, 0) + 1
-            by_type[result.drift_type] = by_type.get(result.drift_type, 0) + 1
-
-        latest = None
-        if self._drift_history:
-            latest = self._drift_history[-1].timestamp.isoformat()
-
         return {
-            "total_issues": len(self._drift_history),
-            "by_severity": by_severity,
-            "by_type": by_type,
-            "latest_drift": latest,
+            "total_issues": len(self._history_types),
+            "by_severity": dict(Counter(self._history_severities)),
+            "by_type": dict(Counter(self._history_types)),
+            "latest_drift": self._latest_drift.isoformat(),
         }
 
     def clear_history(self) -> None:
         """Clear drift detection history."""
-        self._drift_history.clear()
-
+        self._history_types.clear()
+        self._history_severities.clear()
+        self._latest_drift = None
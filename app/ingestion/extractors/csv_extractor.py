@@ -1,10 +1,13 @@
 """CSV file extractor implementation."""
 
 import csv
+import warnings
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+import pandas as pd
+
 from app.core.config import settings
 from app.core.exceptions import ExtractionException
 from app.core.logging import logger
@@ -47,53 +50,67 @@ class CSVExtractor(BaseExtractor):
             )
 
         try:
-            records: list[dict[str, Any]] = []
-
             with open(self.file_path, "r", encoding="utf-8") as f:
                 # Detect delimiter
                 sample = f.read(1024)
-                f.seek(0)
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
-
-                reader = csv.DictReader(f, dialect=dialect)
-
-                # Normalize column names
-                if reader.fieldnames:
-                    reader.fieldnames = [col.strip().lower() for col in reader.fieldnames]
-
-                for row in reader:
-                    # Map columns to internal names
-                    mapped_row = {}
-                    for csv_col, internal_col in self.COLUMN_MAP.items():
-                        if csv_col in row:
-                            mapped_row[internal_col] = row[csv_col]
-
-                    # Include any additional columns
-                    for key, value in row.items():
-                        if key not in self.COLUMN_MAP and key not in mapped_row:
-                            mapped_row[key] = value
-
-                    records.append(mapped_row)
-
-            # Filter by last_processed if provided
-            if last_processed:
-                filtered = []
-                for record in records:
-                    timestamp_str = record.get("timestamp")
-                    if timestamp_str:
-                        try:
-                            # Parse timestamp using RawCryptoRecord validator
-                            parsed = RawCryptoRecord.model_validate({
-                                "symbol": record.get("symbol", "UNKNOWN"),
-                                "timestamp": timestamp_str,
-                            })
-                            if parsed.timestamp > last_processed:
-                                filtered.append(record)
-                        except Exception:
-                            filtered.append(record)
-                    else:
-                        filtered.append(record)
-                records = filtered
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+            header = next(csv.reader(sample.splitlines()[:1], dialect), [])
+
+            # Parse with pandas' C reader; values stay raw strings ("" for
+            # empty cells) so RawCryptoRecord does the coercion as before.
+            # index_col=False stops a trailing delimiter from shifting fields
+            # into the index, and reading only the header's columns keeps
+            # rows with extra fields (the extras are ignored) instead of
+            # dropping them
+            with warnings.catch_warnings(record=True) as parser_warnings:
+                warnings.simplefilter("always", pd.errors.ParserWarning)
+                df = pd.read_csv(
+                    self.file_path,
+                    sep=dialect.delimiter,
+                    quotechar=dialect.quotechar,
+                    dtype=str,
+                    keep_default_na=False,
+                    encoding="utf-8",
+                    index_col=False,
+                    usecols=range(len(header)),
+                    on_bad_lines="warn",
+                )
+            skipped = [
+                str(w.message).strip() for w in parser_warnings
+                if issubclass(w.category, pd.errors.ParserWarning)
+            ]
+            if skipped:
+                logger.warning(
+                    f"CSV: skipped {len(skipped)} malformed lines in {self.file_path}: "
+                    f"{skipped[:5]}"
+                )
+
+            # Normalize column names and map them to internal names; a
+            # mapped column wins over an extra column of the same name
+            df.columns = df.columns.str.strip().str.lower()
+            mapping = {
+                csv_col: internal_col
+                for csv_col, internal_col in self.COLUMN_MAP.items()
+                if csv_col in df.columns
+            }
+            df = df.drop(columns=[c for c in mapping.values() if c in df.columns])
+            df = df.rename(columns=mapping)
+            mapped = [col for col in self.COLUMN_MAP.values() if col in df.columns]
+            df = df[mapped + [c for c in df.columns if c not in mapped]]
+
+            # Filter by last_processed if provided. Timestamps are parsed with
+            # the transformer's own validator, once per distinct value; rows it
+            # cannot parse are kept so normalize() reports them
+            if last_processed and "timestamp" in df.columns:
+                if last_processed.tzinfo is None:
+                    last_processed = last_processed.replace(tzinfo=timezone.utc)
+                is_new = {
+                    value: self._is_after(value, last_processed)
+                    for value in df["timestamp"].unique()
+                }
+                df = df[df["timestamp"].map(is_new).astype(bool)]
+
+            records: list[dict[str, Any]] = df.to_dict(orient="records")
 
             logger.info(f"CSV: read {len(records)} records from {self.file_path}")
             return records
@@ -106,12 +123,28 @@ class CSVExtractor(BaseExtractor):
                 details={"path": str(self.file_path)},
             )
 
+    @staticmethod
+    def _is_after(timestamp: str, last_processed: datetime) -> bool:
+        """Whether a raw timestamp is newer than the checkpoint.
+
+        Empty or unparseable timestamps count as new.
+        """
+        if not timestamp:
+            return True
+        try:
+            parsed = RawCryptoRecord(symbol="", timestamp=timestamp)
+        except ValueError:
+            return True
+        return parsed.timestamp > last_processed
+
     def normalize(self, raw_data: list[dict[str, Any]]) -> list[UnifiedCryptoDataCreate]:
         """Transform CSV records to unified schema.
 
         CSV sources may have limited metadata, uses symbol as fallback for name.
         """
         normalized = []
+        # Fallback timestamp for rows without one, read once per batch
+        now = datetime.now(timezone.utc)
 
         for item in raw_data:
             try:
@@ -122,7 +155,7 @@ class CSVExtractor(BaseExtractor):
                     price_usd=item.get("price_usd", item.get("price")),
                     market_cap=item.get("market_cap"),
                     volume_24h=item.get("volume_24h", item.get("vol")),
-                    timestamp=item.get("timestamp", item.get("date", datetime.now(timezone.utc))),
+                    timestamp=item.get("timestamp", item.get("date", now)),
                 )
 
                 # Create unified schema with source metadata
@@ -1,7 +1,8 @@
-import difflib
 import logging
 from typing import Optional
 
+from rapidfuzz import fuzz, process
+
 logger = logging.getLogger(__name__)
 
 class SymbolNormalizer:
@@ -32,7 +33,8 @@ class SymbolNormalizer:
     VALID_SYMBOLS = sorted(list(set(CANONICAL_MAP.values())))
 
     def __init__(self):
-        pass
+        # Precomputed once; fuzzy matching runs against this list
+        self._canonical_keys = list(self.CANONICAL_MAP.keys())
 
     def normalize(self, input_symbol: str) -> Optional[str]:
         """
@@ -56,11 +58,12 @@ class SymbolNormalizer:
 
         # 3. Fuzzy match
         # We match against the keys of our map to find the likely intent
-        keys = list(self.CANONICAL_MAP.keys())
-        matches = difflib.get_close_matches(cleaned, keys, n=1, cutoff=0.8)
+        best = process.extractOne(
+            cleaned, self._canonical_keys, scorer=fuzz.ratio, score_cutoff=80
+        )
 
-        if matches:
-            match = matches[0]
+        if best:
+            match = best[0]
             canonical = self.CANONICAL_MAP[match]
             logger.info(f"Fuzzy mapped '{input_symbol}' to '{canonical}' (match: '{match}')")
             return canonical
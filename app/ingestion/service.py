@@ -10,14 +10,14 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 
 import pandas as pd
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import DatabaseException, ExtractionException
 from app.core.logging import logger
 from app.core.middleware import metrics_collector
-from app.db.models import DataSource, ETLJob, ETLStatus, RawData, UnifiedCryptoData
+from app.db.models import Base, DataSource, ETLJob, ETLStatus, RawData, UnifiedCryptoData
 from app.db.session import get_session
 from app.ingestion.asset_resolver import AssetResolver
 from app.ingestion.base import BaseExtractor
@@ -75,8 +75,10 @@ class ETLService:
         Query ETLJob table for last successful run timestamp.
         Used for incremental loading.
         """
-        query = (
-            select(ETLJob.last_processed_timestamp)
+        # lambda_stmt: the statement is built and compiled once per process,
+        # later calls only bind ``source``
+        query = lambda_stmt(
+            lambda: select(ETLJob.last_processed_timestamp)
             .where(ETLJob.source == source)
             .where(ETLJob.status == ETLStatus.SUCCESS)
             .order_by(ETLJob.completed_at.desc())
@@ -100,6 +102,71 @@ class ETLService:
         await session.flush()
         return job
 
+    async def bulk_load(
+        self,
+        session: AsyncSession,
+        rows: list[dict[str, Any]],
+        model: type[Base] = UnifiedCryptoData,
+    ) -> int:
+        """
+        Append rows to a model's table in one round-trip, bypassing the ORM.
+
+        Uses COPY FROM STDIN on PostgreSQL (asyncpg) and a single executemany
+        INSERT on other backends. There is no conflict handling: use it for
+        loads into empty or disjoint ranges (backfills, fixtures) and
+        resolve_and_upsert_unified_data for incremental ingest.
+
+        Every row must have the same keys, all of them columns of the
+        model's table; otherwise ValueError is raised before anything is
+        written. Omitted columns take their scalar Python-side defaults
+        (``default=``) on both paths, else their server defaults. COPY cannot
+        evaluate callable Python defaults, so omitting such a column is also
+        a ValueError.
+
+        Returns count of loaded rows.
+        """
+        if not rows:
+            return 0
+
+        table = model.__table__
+        columns = list(rows[0])
+        unknown = set(columns).difference(table.columns.keys())
+        if unknown:
+            raise ValueError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            raise ValueError(f"Rows for {table.name} must all have the same keys")
+        # Python-side defaults of omitted columns; executemany applies these
+        # itself, COPY needs them supplied explicitly
+        defaults: dict[str, Any] = {}
+        for column in table.columns:
+            if column.name in keys or column.default is None:
+                continue
+            if not column.default.is_scalar:
+                raise ValueError(
+                    f"Column {table.name}.{column.name} has a callable default; "
+                    "include it in the rows"
+                )
+            defaults[column.name] = column.default.arg
+
+        conn = await session.connection()
+        if conn.dialect.name == "postgresql":
+            raw = await conn.get_raw_connection()
+            # asyncpg returns the command status tag, e.g. "COPY 42"
+            default_values = tuple(defaults.values())
+            status = await raw.driver_connection.copy_records_to_table(
+                table.name,
+                records=[tuple(row[c] for c in columns) + default_values for row in rows],
+                columns=columns + list(defaults),
+            )
+            loaded = int(status.split()[-1])
+        else:
+            result = await conn.execute(insert(table), rows)
+            loaded = result.rowcount
+
+        logger.debug(f"Bulk loaded {loaded} rows into {table.name}")
+        return loaded
+
     async def save_raw_data(
         self,
         session: AsyncSession,
@@ -178,7 +245,8 @@ class ETLService:
                 f"Dropped {dropped} duplicate records before upsert."
             )
 
-        # Build values for bulk upsert with coin_id
+        # Build values for bulk upsert with coin_id; one clock read per batch
+        ingested_at = datetime.now(timezone.utc)
         values = [
             {
                 "coin_id": coin_id,
@@ -188,7 +256,7 @@ class ETLService:
                 "volume_24h": record.volume_24h,
                 "source": record.source,
                 "timestamp": record.timestamp,
-                "ingested_at": datetime.now(timezone.utc),
+                "ingested_at": ingested_at,
             }
             for coin_id, record in deduplicated
         ]
@@ -360,7 +428,7 @@ class ETLService:
     ) -> None:
         """Update ETL job record with final status."""
         async with get_session() as session:
-            query = select(ETLJob).where(ETLJob.id == job_id)
+            query = lambda_stmt(lambda: select(ETLJob).where(ETLJob.id == job_id))
             result = await session.execute(query)
             job = result.scalar_one()
 
@@ -1,15 +1,76 @@
-"""Pydantic schemas for data normalization and validation."""
+"""Schemas for data normalization and validation.
+
+RawCryptoRecord is built once per extracted row, so it is a msgspec Struct
+normalizing its fields in ``__post_init__``; the API response schemas are
+validated once per payload item and stay Pydantic.
+"""
 
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+import msgspec
+from pydantic import BaseModel, Field
 
 from app.core.logging import logger
 
-
-class RawCryptoRecord(BaseModel):
-    """Intermediate schema for validating raw crypto data before normalization."""
+# Timestamp string formats accepted from sources, tried in order
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
+def _normalize_symbol(v: Any) -> str:
+    """Standardize symbol to uppercase, strip whitespace."""
+    if isinstance(v, str):
+        return v.strip().upper()
+    return str(v).upper()
+
+
+def _coerce_to_float(v: Any) -> Optional[float]:
+    """Convert string/int values to float, handle nulls."""
+    if v is None or v == "" or v == "N/A":
+        return None
+    try:
+        return float(v)
+    except (ValueError, TypeError):
+        logger.warning(f"Failed to coerce value '{v}' to float")
+        return None
+
+
+def _normalize_timestamp(v: Any) -> datetime:
+    """Convert various timestamp formats to UTC datetime."""
+    if isinstance(v, datetime):
+        if v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        return v.astimezone(timezone.utc)
+
+    if isinstance(v, str):
+        for fmt in _TIMESTAMP_FORMATS:
+            try:
+                dt = datetime.strptime(v, fmt)
+                return dt.replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+
+    if isinstance(v, (int, float)):
+        # Unix timestamp
+        return datetime.fromtimestamp(v, tz=timezone.utc)
+
+    raise ValueError(f"Unable to parse timestamp: {v}")
+
+
+class RawCryptoRecord(msgspec.Struct, kw_only=True, gc=False):
+    """Intermediate schema for validating raw crypto data before normalization.
+
+    Fields accept raw source values and are normalized on construction:
+    symbols are stripped and uppercased, numbers coerced to float ("", "N/A"
+    and unparseable values become None) and timestamps converted to UTC.
+    An unparseable timestamp raises ValueError.
+    """
 
     symbol: str
     price_usd: Optional[float] = None
@@ -17,56 +78,12 @@ class RawCryptoRecord(BaseModel):
     volume_24h: Optional[float] = None
     timestamp: datetime
 
-    @field_validator("symbol", mode="before")
-    @classmethod
-    def normalize_symbol(cls, v: Any) -> str:
-        """Standardize symbol to uppercase, strip whitespace."""
-        if isinstance(v, str):
-            return v.strip().upper()
-        return str(v).upper()
-
-    @field_validator("price_usd", "market_cap", "volume_24h", mode="before")
-    @classmethod
-    def coerce_to_float(cls, v: Any) -> Optional[float]:
-        """Convert string/int values to float, handle nulls."""
-        if v is None or v == "" or v == "N/A":
-            return None
-        try:
-            return float(v)
-        except (ValueError, TypeError):
-            logger.warning(f"Failed to coerce value '{v}' to float")
-            return None
-
-    @field_validator("timestamp", mode="before")
-    @classmethod
-    def normalize_timestamp(cls, v: Any) -> datetime:
-        """Convert various timestamp formats to UTC datetime."""
-        if isinstance(v, datetime):
-            if v.tzinfo is None:
-                return v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc)
-
-        if isinstance(v, str):
-            # Handle common ISO formats
-            formats = [
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-            ]
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(v, fmt)
-                    return dt.replace(tzinfo=timezone.utc)
-                except ValueError:
-                    continue
-
-        if isinstance(v, (int, float)):
-            # Unix timestamp
-            return datetime.fromtimestamp(v, tz=timezone.utc)
-
-        raise ValueError(f"Unable to parse timestamp: {v}")
+    def __post_init__(self) -> None:
+        self.symbol = _normalize_symbol(self.symbol)
+        self.price_usd = _coerce_to_float(self.price_usd)
+        self.market_cap = _coerce_to_float(self.market_cap)
+        self.volume_24h = _coerce_to_float(self.volume_24h)
+        self.timestamp = _normalize_timestamp(self.timestamp)
 
 
 class CoinPaprikaResponse(BaseModel):
@@ -1,11 +1,13 @@
 """FastAPI application entry point."""
 
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from app.api.routes import router
 from app.core.config import settings
@@ -54,11 +56,24 @@ async def root():
     return RedirectResponse(url="/docs")
 
 
-@app.get("/health")
+# (epoch seconds, ISO string) of the last formatted health timestamp.
+# Liveness probes only need second resolution, so the string is reused.
+_health_timestamp: tuple[float, str] = (0.0, "")
+
+
+def _health_timestamp_iso() -> str:
+    """Return the current UTC time as ISO 8601, refreshed at most once a second."""
+    global _health_timestamp
+    now = time.time()
+    if now - _health_timestamp[0] >= 1.0:
+        _health_timestamp = (now, datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+    return _health_timestamp[1]
+
+
+@app.get("/health", response_class=ORJSONResponse, response_model=None)
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
-    from datetime import datetime, timezone
     return {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _health_timestamp_iso(),
     }
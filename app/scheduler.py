@@ -122,6 +122,14 @@ class ETLScheduler:
             self.scheduler.shutdown()
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        # Not built for Windows; the default asyncio loop works too
+        pass
+    else:
+        uvloop.install()
+
     scheduler = ETLScheduler()
     try:
         asyncio.run(scheduler.start())
@@ -7,16 +7,57 @@ Includes schemas for:
 - API responses
 """
 
+import os
+import threading
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, TypeVar
+from typing import Any, Mapping, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.middleware import current_request_time
 from app.db.models import DataSource, ETLStatus
 
 T = TypeVar("T")
 
+# Shared config for output-only schemas, populated from ORM rows.
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True)
+
+# Leaf response schemas allocated per row/response: immutable, no extras,
+# and declared with empty __slots__ so instances carry no __weakref__ slot.
+_LEAF_RESPONSE_CONFIG = ConfigDict(**_RESPONSE_CONFIG, frozen=True, extra="forbid")
+
+
+_REQUEST_ID_BATCH = 1024
+_request_id_pool: list[str] = []
+_request_id_lock = threading.Lock()
+
+
+def next_request_id() -> str:
+    """Return a random UUID4 string from a pool refilled in bulk.
+
+    One os.urandom read covers a whole batch instead of one syscall per
+    response.
+    """
+    try:
+        return _request_id_pool.pop()
+    except IndexError:
+        pass
+    with _request_id_lock:
+        if not _request_id_pool:
+            raw = os.urandom(16 * _REQUEST_ID_BATCH)
+            _request_id_pool.extend(
+                str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+                for i in range(0, len(raw), 16)
+            )
+        return _request_id_pool.pop()
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Coerce a Numeric column value (Decimal) to float, passing None through."""
+    return None if value is None else float(value)
+
 
 # =============================================================================
 # COIN MASTER ENTITY SCHEMAS
@@ -105,7 +146,9 @@ class RawDataSchema(BaseModel):
 class UnifiedCryptoDataSchema(BaseModel):
     """Schema for normalized crypto data."""
 
-    model_config = ConfigDict(from_attributes=True)
+    __slots__ = ()
+
+    model_config = _LEAF_RESPONSE_CONFIG
 
     id: int
     coin_id: Optional[int] = None  # Reference to canonical Coin
@@ -117,6 +160,25 @@ class UnifiedCryptoDataSchema(BaseModel):
     ingested_at: datetime
     timestamp: datetime
 
+    @classmethod
+    def from_orm_trusted(cls, row: Any) -> "UnifiedCryptoDataSchema":
+        """Build from a UnifiedCryptoData row without re-running validators.
+
+        Rows come from our own typed columns, so only the Numeric -> float
+        coercion is applied. Never use this for ingest-side data.
+        """
+        return cls.model_construct(
+            id=row.id,
+            coin_id=row.coin_id,
+            symbol=row.symbol,
+            price_usd=_to_float(row.price_usd),
+            market_cap=_to_float(row.market_cap),
+            volume_24h=_to_float(row.volume_24h),
+            source=row.source,
+            ingested_at=row.ingested_at,
+            timestamp=row.timestamp,
+        )
+
 
 class UnifiedCryptoDataCreate(BaseModel):
     """Schema for creating unified crypto data.
@@ -148,7 +210,7 @@ class UnifiedCryptoDataCreate(BaseModel):
 class UnifiedCryptoDataWithCoin(BaseModel):
     """Unified crypto data with embedded coin info for rich API responses."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
     id: int
     symbol: str
@@ -164,7 +226,7 @@ class UnifiedCryptoDataWithCoin(BaseModel):
 class ETLJobSchema(BaseModel):
     """Schema for ETL job records."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
     id: int
     source: DataSource
@@ -179,6 +241,8 @@ class ETLJobSchema(BaseModel):
 class PaginatedResponse(BaseModel):
     """Generic paginated response wrapper."""
 
+    model_config = _RESPONSE_CONFIG
+
     items: list[Any]
     total: int
     page: int
@@ -186,37 +250,81 @@ class PaginatedResponse(BaseModel):
     total_pages: int
 
 
-class CryptoQueryParams(BaseModel):
-    """Query parameters for crypto data endpoints."""
+@dataclass(slots=True)
+class CryptoQueryParams:
+    """Query parameters for crypto data endpoints.
+
+    Parsed in one pass by from_request rather than through Pydantic, with
+    the same bounds the Field constraints enforced: page >= 1 and
+    1 <= page_size <= 100.
+    """
 
     symbol: Optional[str] = None
     source: Optional[DataSource] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    page: int = Field(default=1, ge=1)
-    page_size: int = Field(default=50, ge=1, le=100)
+    page: int = 1
+    page_size: int = 50
+
+    @classmethod
+    def from_request(cls, q: Mapping[str, str]) -> "CryptoQueryParams":
+        """Build from raw query-string values.
+
+        Raises ValueError for unparseable numbers, dates or sources and for
+        out-of-range page/page_size.
+        """
+        page = int(q.get("page", 1))
+        page_size = int(q.get("page_size", 50))
+        if page < 1:
+            raise ValueError(f"page must be >= 1, got {page}")
+        if not 1 <= page_size <= 100:
+            raise ValueError(f"page_size must be between 1 and 100, got {page_size}")
+        start_date = q.get("start_date")
+        end_date = q.get("end_date")
+        source = q.get("source")
+        return cls(
+            symbol=q.get("symbol") or None,
+            source=DataSource(source) if source else None,
+            start_date=datetime.fromisoformat(start_date) if start_date else None,
+            end_date=datetime.fromisoformat(end_date) if end_date else None,
+            page=page,
+            page_size=page_size,
+        )
 
 
 # ============== Enhanced API Response Schemas ==============
 
 
-class ResponseMetadata(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ResponseMetadata:
     """Metadata included in all API responses."""
 
-    request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     total_records: int
     api_latency_ms: float
+    request_id: str = field(default_factory=next_request_id)
+
+
+@dataclass(slots=True, frozen=True)
+class Pagination:
+    """Limit/offset pagination block of the /data response."""
+
+    limit: int
+    offset: int
+    total: int
 
 
 class DataResponse(BaseModel):
     """Response schema for /data endpoint with metadata."""
 
+    model_config = _RESPONSE_CONFIG
+
     metadata: ResponseMetadata
     data: list[UnifiedCryptoDataSchema]
-    pagination: dict[str, int]
+    pagination: Pagination
 
 
-class DBHealthStatus(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DBHealthStatus:
     """Database health status."""
 
     connected: bool
@@ -224,7 +332,8 @@ class DBHealthStatus(BaseModel):
     error: Optional[str] = None
 
 
-class ETLHealthStatus(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ETLHealthStatus:
     """ETL system health status."""
 
     last_run_source: Optional[DataSource] = None
@@ -237,8 +346,10 @@ class ETLHealthStatus(BaseModel):
 class HealthResponse(BaseModel):
     """Response schema for /health endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     status: str = Field(..., description="Overall system status: healthy, degraded, unhealthy")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now())
+    timestamp: datetime = Field(default_factory=current_request_time)
     database: DBHealthStatus
     etl: ETLHealthStatus
     metadata: Optional[ResponseMetadata] = None
@@ -247,17 +358,25 @@ class HealthResponse(BaseModel):
 class SymbolStats(BaseModel):
     """Statistics per symbol."""
 
+    __slots__ = ()
+
+    model_config = _LEAF_RESPONSE_CONFIG
+
     symbol: str
     avg_price_usd: Optional[float] = None
     min_price_usd: Optional[float] = None
     max_price_usd: Optional[float] = None
     record_count: int
-    sources: list[str]
+    sources: tuple[str, ...]
 
 
 class ETLStats(BaseModel):
     """ETL job statistics."""
 
+    __slots__ = ()
+
+    model_config = _LEAF_RESPONSE_CONFIG
+
     total_jobs: int
     successful_jobs: int
     failed_jobs: int
@@ -270,10 +389,12 @@ class ETLStats(BaseModel):
 class StatsResponse(BaseModel):
     """Response schema for /stats endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     metadata: ResponseMetadata
     total_records: int
     unique_symbols: int
-    sources_active: list[str]
+    sources_active: tuple[str, ...]
     symbol_stats: list[SymbolStats]
     etl_stats: ETLStats
     data_freshness: Optional[datetime] = Field(
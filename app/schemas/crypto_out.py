@@ -0,0 +1,67 @@
+"""msgspec output structs for high-volume API responses.
+
+These mirror the Pydantic response schemas in ``app.schemas.crypto`` field
+for field, so the JSON produced is the same shape. They are output-only:
+nothing here validates input. Enabled via ``settings.fast_serialization``.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+import msgspec
+
+from app.db.models import DataSource
+from app.schemas.crypto import Pagination, _to_float
+
+
+class UnifiedCryptoDataOut(msgspec.Struct, frozen=True, gc=False):
+    """Output struct for a unified crypto data row."""
+
+    id: int
+    coin_id: Optional[int]
+    symbol: str
+    price_usd: Optional[float]
+    market_cap: Optional[float]
+    volume_24h: Optional[float]
+    source: DataSource
+    ingested_at: datetime
+    timestamp: datetime
+
+    @classmethod
+    def from_orm(cls, row: Any) -> "UnifiedCryptoDataOut":
+        """Build from a UnifiedCryptoData row."""
+        return cls(
+            id=row.id,
+            coin_id=row.coin_id,
+            symbol=row.symbol,
+            price_usd=_to_float(row.price_usd),
+            market_cap=_to_float(row.market_cap),
+            volume_24h=_to_float(row.volume_24h),
+            source=row.source,
+            ingested_at=row.ingested_at,
+            timestamp=row.timestamp,
+        )
+
+
+class ResponseMetadataOut(msgspec.Struct, frozen=True, gc=False):
+    """Output struct for response metadata (same field order as ResponseMetadata)."""
+
+    total_records: int
+    api_latency_ms: float
+    request_id: str
+
+
+class DataResponseOut(msgspec.Struct, frozen=True):
+    """Output struct for the /data response body."""
+
+    metadata: ResponseMetadataOut
+    data: list[UnifiedCryptoDataOut]
+    pagination: Pagination
+
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def encode(obj: msgspec.Struct) -> bytes:
+    """Encode an output struct to JSON bytes."""
+    return _ENCODER.encode(obj)
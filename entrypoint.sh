@@ -55,7 +55,7 @@ fi
 if [ $# -eq 0 ]; then
     # Default: Start web server
     echo "Starting Kasparro API server..."
-    exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+    exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop
 else
     # Custom command (e.g., scheduler)
     echo "Starting custom command: $@"
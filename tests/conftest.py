@@ -5,29 +5,54 @@ import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import AsyncGenerator
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Final, Mapping
 
+import orjson
+import pandas as pd
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert, make_url, select
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import StaticPool
 
-from app.db.models import Base, Coin, DataSource, UnifiedCryptoData
-from app.db.session import get_db
+from app.db.models import Base, Coin, DataSource
+from app.db.session import get_db, orjson_dumps
+from app.ingestion.asset_resolver import AssetResolver
+from app.ingestion.service import ETLService
 from app.main import app
 
 # ============== Pytest Configuration ==============
 
 
+def pytest_collection_modifyitems(config, items):
+    """Mark every test not explicitly marked ``unit`` as ``integration``."""
+    for item in items:
+        if item.get_closest_marker("unit") is None:
+            item.add_marker(pytest.mark.integration)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """
+    Create the event loop for the test session.
+    Uses uvloop (installed with uvicorn[standard]) where available; it is
+    not built for Windows, which falls back to the default asyncio loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
     yield loop
     loop.close()
 
@@ -41,6 +66,26 @@ def anyio_backend():
 # ============== Database URL Selection ==============
 
 
+# pytest-xdist sets this in each worker process ("gw0", "gw1", ...)
+XDIST_WORKER: Final = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def _worker_database_url(db_url: str) -> str:
+    """
+    Give each xdist worker its own SQLite file (test.db -> test_gw0.db).
+    In-memory SQLite is already private to the worker process, and other
+    backends are returned unchanged.
+    """
+    url = make_url(db_url)
+    if XDIST_WORKER == "main" or not url.drivername.startswith("sqlite"):
+        return db_url
+    if url.database in (None, "", ":memory:"):
+        return db_url
+    path = Path(url.database)
+    worker_db = path.with_name(f"{path.stem}_{XDIST_WORKER}{path.suffix}")
+    return url.set(database=str(worker_db)).render_as_string(hide_password=False)
+
+
 def get_test_database_url() -> str:
     """
     Get test database URL.
@@ -52,33 +97,73 @@ def get_test_database_url() -> str:
         # Ensure it's async-compatible
         if pg_url.startswith("postgresql://"):
             pg_url = pg_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        return pg_url
+        return _worker_database_url(pg_url)
 
     # Fallback to SQLite for fast local unit tests
     return "sqlite+aiosqlite:///:memory:"
 
 
+def pytest_xdist_auto_num_workers(config):
+    """
+    Keep '-n auto' serial against a shared server database, where every
+    worker would create and drop the same tables. SQLite databases are
+    per worker, so those runs use xdist's default of one worker per CPU.
+    """
+    if "sqlite" not in get_test_database_url():
+        return 0
+    return None
+
+
 # ============== Database Fixtures ==============
 
 
-@pytest_asyncio.fixture
+def _enable_sqlite_savepoints(engine) -> None:
+    """Let pysqlite/aiosqlite emit BEGIN/SAVEPOINT themselves.
+
+    The sqlite3 driver otherwise manages transactions on its own and breaks
+    SAVEPOINT, which the per-test rollback isolation relies on. Tests do not
+    need durability, so file-backed databases also skip fsync on commit.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session")
 async def test_engine():
-    """Create test database engine - uses PostgreSQL in CI, SQLite locally."""
+    """Create test database engine once per session - PostgreSQL in CI, SQLite locally."""
     db_url = get_test_database_url()
 
     # Configure engine based on database type
     if "sqlite" in db_url:
+        # One connection for the whole session: it keeps an in-memory
+        # database alive and there is no reconnect cost between tests,
+        # so a shared-cache URI is not needed.
         engine = create_async_engine(
             db_url,
             echo=False,
             future=True,
+            json_serializer=orjson_dumps,
+            json_deserializer=orjson.loads,
+            poolclass=StaticPool,
         )
+        _enable_sqlite_savepoints(engine)
     else:
         # PostgreSQL settings for CI parity
         engine = create_async_engine(
             db_url,
             echo=False,
             future=True,
+            json_serializer=orjson_dumps,
+            json_deserializer=orjson.loads,
             pool_size=5,
             max_overflow=10,
         )
@@ -95,36 +180,71 @@ async def test_engine():
     await engine.dispose()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def _warm_engine(test_engine):
+    """
+    Configure mappers and prime the dialect's compiled-statement cache once,
+    so the first DB test does not absorb those one-time costs.
+    """
+    configure_mappers()
+    async with test_engine.connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            await conn.execute(select(table).limit(0))
+    return test_engine
+
+
 @pytest_asyncio.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session with transaction rollback."""
-    async_session = async_sessionmaker(
-        test_engine,
+async def db_connection(
+    request, _warm_engine
+) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Per-test connection wrapped in an outer transaction.
+    Sessions bound to it commit into SAVEPOINTs; everything is rolled back
+    at teardown, so tests never see each other's rows.
+    """
+    if request.node.get_closest_marker("unit") is not None:
+        pytest.fail("tests marked 'unit' must not use the database")
+    async with _warm_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
+
+
+@pytest.fixture(scope="session")
+def _sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Session factory shared by every DB fixture, built once.
+    Sessions are bound per test to db_connection; their commits release a
+    SAVEPOINT on that connection.
+    """
+    return async_sessionmaker(
         class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    async with async_session() as session:
+
+@pytest_asyncio.fixture
+async def test_session(
+    _sessionmaker, db_connection
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session with transaction rollback."""
+    async with _sessionmaker(bind=db_connection) as session:
         yield session
         # Rollback any uncommitted changes
         await session.rollback()
 
 
 @pytest_asyncio.fixture
-async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(
+    _sessionmaker, db_connection
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Create a database session for testing with automatic cleanup.
     Alias for test_session for compatibility.
     """
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
-
-    async with async_session() as session:
+    async with _sessionmaker(bind=db_connection) as session:
         yield session
         await session.rollback()
 
@@ -132,31 +252,37 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
 # ============== FastAPI Test Client Fixtures ==============
 
 
-@pytest_asyncio.fixture
-async def async_client(test_engine) -> AsyncGenerator[AsyncClient, None]:
+@pytest_asyncio.fixture(scope="session")
+async def _session_client() -> AsyncGenerator[AsyncClient, None]:
     """
-    Create async HTTP client for testing FastAPI endpoints.
-    Overrides the database dependency to use test database.
+    ASGI transport and client built once for the whole test session.
+    The app's lifespan runs once around it, as it would under uvicorn
+    (ASGITransport does not send lifespan events itself). One warmup
+    request primes the middleware stack and routing before the first test.
     """
-    # Create session factory for test database
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
+    transport = ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/health")
+            yield client
+
 
+@pytest_asyncio.fixture
+async def async_client(
+    _session_client: AsyncClient, _sessionmaker, db_connection
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Async HTTP client for testing FastAPI endpoints.
+    Overrides the database dependency to use the per-test connection.
+    """
     # Override the get_db dependency
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        async with async_session() as session:
+        async with _sessionmaker(bind=db_connection) as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    # Create async client
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+    yield _session_client
 
     # Clear dependency overrides
     app.dependency_overrides.clear()
@@ -171,110 +297,133 @@ def sync_client(test_engine) -> TestClient:
 # ============== Mock Data Fixtures ==============
 
 
-@pytest.fixture
-def sample_crypto_data() -> list[dict]:
-    """Sample cryptocurrency data for testing."""
-    return [
-        {
-            "symbol": "BTC",
-            "price_usd": 45000.50,
-            "market_cap": 850000000000,
-            "volume_24h": 25000000000,
-            "timestamp": datetime(2024, 1, 15, tzinfo=timezone.utc),
-        },
-        {
-            "symbol": "ETH",
-            "price_usd": 2500.00,
-            "market_cap": 300000000000,
-            "volume_24h": 15000000000,
-            "timestamp": datetime(2024, 1, 15, tzinfo=timezone.utc),
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Built once at import; fixtures hand out the same read-only objects.
+# Tests that need to mutate a record must copy it explicitly.
+_SAMPLE_CRYPTO_DATA: Final = _freeze([
+    {
+        "symbol": "BTC",
+        "price_usd": 45000.50,
+        "market_cap": 850000000000,
+        "volume_24h": 25000000000,
+        "timestamp": datetime(2024, 1, 15, tzinfo=timezone.utc),
+    },
+    {
+        "symbol": "ETH",
+        "price_usd": 2500.00,
+        "market_cap": 300000000000,
+        "volume_24h": 15000000000,
+        "timestamp": datetime(2024, 1, 15, tzinfo=timezone.utc),
+    },
+    {
+        "symbol": "XRP",
+        "price_usd": 0.55,
+        "market_cap": 28000000000,
+        "volume_24h": 5000000000,
+        "timestamp": datetime(2024, 1, 15, tzinfo=timezone.utc),
+    },
+])
+
+_COINGECKO_API_RESPONSE: Final = _freeze([
+    {
+        "id": "bitcoin",
+        "symbol": "btc",
+        "name": "Bitcoin",
+        "current_price": 45000.50,
+        "market_cap": 850000000000,
+        "total_volume": 25000000000,
+        "last_updated": "2024-01-15T12:00:00.000Z",
+    },
+    {
+        "id": "ethereum",
+        "symbol": "eth",
+        "name": "Ethereum",
+        "current_price": 2500.00,
+        "market_cap": 300000000000,
+        "total_volume": 15000000000,
+        "last_updated": "2024-01-15T12:00:00.000Z",
+    },
+])
+
+_COINPAPRIKA_API_RESPONSE: Final = _freeze([
+    {
+        "id": "btc-bitcoin",
+        "name": "Bitcoin",
+        "symbol": "BTC",
+        "rank": 1,
+        "quotes": {
+            "USD": {
+                "price": 45000.50,
+                "market_cap": 850000000000,
+                "volume_24h": 25000000000,
+            }
         },
-        {
-            "symbol": "XRP",
-            "price_usd": 0.55,
-            "market_cap": 28000000000,
-            "volume_24h": 5000000000,
-            "timestamp": datetime(2024, 1, 15, tzinfo=timezone.utc),
+        "last_updated": "2024-01-15T12:00:00Z",
+    },
+    {
+        "id": "eth-ethereum",
+        "name": "Ethereum",
+        "symbol": "ETH",
+        "rank": 2,
+        "quotes": {
+            "USD": {
+                "price": 2500.00,
+                "market_cap": 300000000000,
+                "volume_24h": 15000000000,
+            }
         },
-    ]
+        "last_updated": "2024-01-15T12:00:00Z",
+    },
+])
 
 
-@pytest.fixture
-def coingecko_api_response() -> list[dict]:
+@pytest.fixture(scope="session")
+def sample_crypto_data() -> tuple[Mapping[str, Any], ...]:
+    """Sample cryptocurrency data for testing."""
+    return _SAMPLE_CRYPTO_DATA
+
+
+@pytest.fixture(scope="session")
+def coingecko_api_response() -> tuple[Mapping[str, Any], ...]:
     """Mock CoinGecko API response for testing."""
-    return [
-        {
-            "id": "bitcoin",
-            "symbol": "btc",
-            "name": "Bitcoin",
-            "current_price": 45000.50,
-            "market_cap": 850000000000,
-            "total_volume": 25000000000,
-            "last_updated": "2024-01-15T12:00:00.000Z",
-        },
-        {
-            "id": "ethereum",
-            "symbol": "eth",
-            "name": "Ethereum",
-            "current_price": 2500.00,
-            "market_cap": 300000000000,
-            "total_volume": 15000000000,
-            "last_updated": "2024-01-15T12:00:00.000Z",
-        },
-    ]
+    return _COINGECKO_API_RESPONSE
 
 
-@pytest.fixture
-def coinpaprika_api_response() -> list[dict]:
+@pytest.fixture(scope="session")
+def coinpaprika_api_response() -> tuple[Mapping[str, Any], ...]:
     """Mock CoinPaprika API response for testing."""
-    return [
-        {
-            "id": "btc-bitcoin",
-            "name": "Bitcoin",
-            "symbol": "BTC",
-            "rank": 1,
-            "quotes": {
-                "USD": {
-                    "price": 45000.50,
-                    "market_cap": 850000000000,
-                    "volume_24h": 25000000000,
-                }
-            },
-            "last_updated": "2024-01-15T12:00:00Z",
-        },
-        {
-            "id": "eth-ethereum",
-            "name": "Ethereum",
-            "symbol": "ETH",
-            "rank": 2,
-            "quotes": {
-                "USD": {
-                    "price": 2500.00,
-                    "market_cap": 300000000000,
-                    "volume_24h": 15000000000,
-                }
-            },
-            "last_updated": "2024-01-15T12:00:00Z",
-        },
-    ]
+    return _COINPAPRIKA_API_RESPONSE
 
 
 # ============== Temporary File Fixtures ==============
 
 
+def _write_temp_csv(columns: dict[str, list]) -> Path:
+    """Write column data to a temporary CSV in one vectorized to_csv call."""
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+        temp_path = Path(f.name)
+    pd.DataFrame(columns).to_csv(temp_path, index=False)
+    return temp_path
+
+
 @pytest.fixture
 def temp_csv_file() -> Path:
     """Create a temporary CSV file for testing."""
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".csv",
-        delete=False,
-    ) as f:
-        f.write("ticker,price,vol,date,market_cap\n")
-        f.write("BTC,45000.50,25000000000,2024-01-15,850000000000\n")
-        f.write("ETH,2500.00,15000000000,2024-01-15,300000000000\n")
-        f.write("XRP,0.55,5000000000,2024-01-15,28000000000\n")
-        temp_path = Path(f.name)
+    temp_path = _write_temp_csv({
+        "ticker": ["BTC", "ETH", "XRP"],
+        "price": [45000.50, 2500.00, 0.55],
+        "vol": [25000000000, 15000000000, 5000000000],
+        "date": ["2024-01-15"] * 3,
+        "market_cap": [850000000000, 300000000000, 28000000000],
+    })
 
     yield temp_path
 
@@ -286,17 +435,16 @@ def temp_csv_file() -> Path:
 @pytest.fixture
 def temp_csv_with_extra_columns() -> Path:
     """Create a CSV file with unexpected extra columns for schema drift testing."""
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".csv",
-        delete=False,
-    ) as f:
-        # Include unexpected columns: weird_col, extra_field
-        f.write("ticker,price,vol,date,market_cap,weird_col,extra_field\n")
-        f.write("BTC,45000.50,25000000000,2024-01-15,850000000000,unexpected_value,123\n")
-        f.write("ETH,2500.00,15000000000,2024-01-15,300000000000,another_value,456\n")
-        f.write("SOL,95.50,3000000000,2024-01-15,40000000000,random_data,789\n")
-        temp_path = Path(f.name)
+    # Include unexpected columns: weird_col, extra_field
+    temp_path = _write_temp_csv({
+        "ticker": ["BTC", "ETH", "SOL"],
+        "price": [45000.50, 2500.00, 95.50],
+        "vol": [25000000000, 15000000000, 3000000000],
+        "date": ["2024-01-15"] * 3,
+        "market_cap": [850000000000, 300000000000, 40000000000],
+        "weird_col": ["unexpected_value", "another_value", "random_data"],
+        "extra_field": [123, 456, 789],
+    })
 
     yield temp_path
 
@@ -308,16 +456,13 @@ def temp_csv_with_extra_columns() -> Path:
 @pytest.fixture
 def temp_csv_missing_columns() -> Path:
     """Create a CSV file with missing optional columns."""
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".csv",
-        delete=False,
-    ) as f:
-        # Missing market_cap column
-        f.write("ticker,price,vol,date\n")
-        f.write("BTC,45000.50,25000000000,2024-01-15\n")
-        f.write("ETH,2500.00,15000000000,2024-01-15\n")
-        temp_path = Path(f.name)
+    # Missing market_cap column
+    temp_path = _write_temp_csv({
+        "ticker": ["BTC", "ETH"],
+        "price": [45000.50, 2500.00],
+        "vol": [25000000000, 15000000000],
+        "date": ["2024-01-15"] * 2,
+    })
 
     yield temp_path
 
@@ -326,53 +471,70 @@ def temp_csv_missing_columns() -> Path:
         temp_path.unlink()
 
 
+@pytest.fixture(scope="session")
+def malformed_csv(tmp_path_factory) -> Path:
+    """CSV with a non-numeric price, written once per session (read-only)."""
+    path = tmp_path_factory.mktemp("csv") / "malformed.csv"
+    path.write_text("symbol,price\nBTC,not_a_number\nETH,50000")
+    return path
+
+
 # ============== ETL Service Fixtures ==============
 
 
 @pytest.fixture
 def mock_etl_service():
     """Create a mock ETL service for testing."""
-    from app.ingestion.service import ETLService
-
     service = ETLService()
     return service
 
 
+@pytest.fixture
+def resolver() -> AssetResolver:
+    """
+    Fresh AssetResolver per test. Its cache holds coin ids, so it must not
+    outlive the per-test transaction those ids were created in.
+    """
+    return AssetResolver()
+
+
 @pytest_asyncio.fixture
-async def seeded_db(test_session: AsyncSession, sample_crypto_data: list[dict]):
+async def seeded_db(
+    test_session: AsyncSession, sample_crypto_data: tuple[Mapping[str, Any], ...]
+):
     """
     Seed the test database with sample data.
     Returns the session with data already committed.
     Creates canonical Coin entities and links UnifiedCryptoData via coin_id.
     """
 
-    # First create Coin entities
-    coins = {}
-    for data in sample_crypto_data:
-        symbol = data["symbol"]
-        if symbol not in coins:
-            coin = Coin(
-                symbol=symbol,
-                name=symbol,  # Use symbol as name for test data
-                slug=symbol.lower(),
-            )
-            test_session.add(coin)
-            coins[symbol] = coin
-
-    await test_session.flush()  # Get coin IDs
-
-    # Now create UnifiedCryptoData with coin_id
-    for data in sample_crypto_data:
-        record = UnifiedCryptoData(
-            coin_id=coins[data["symbol"]].id,
-            symbol=data["symbol"],
-            price_usd=data["price_usd"],
-            market_cap=data["market_cap"],
-            volume_24h=data["volume_24h"],
-            source=DataSource.CSV,
-            timestamp=data["timestamp"],
-        )
-        test_session.add(record)
+    # First create Coin entities in one batched INSERT ... RETURNING
+    symbols = dict.fromkeys(data["symbol"] for data in sample_crypto_data)
+    result = await test_session.execute(
+        insert(Coin).returning(Coin.id, Coin.symbol),
+        [
+            {
+                "symbol": symbol,
+                "name": symbol,  # Use symbol as name for test data
+                "slug": symbol.lower(),
+            }
+            for symbol in symbols
+        ],
+    )
+    coin_id_by_symbol = {row.symbol: row.id for row in result}
+
+    # Now load UnifiedCryptoData with coin_id through the production bulk path
+    await ETLService().bulk_load(
+        test_session,
+        [
+            {
+                **data,
+                "coin_id": coin_id_by_symbol[data["symbol"]],
+                "source": DataSource.CSV,
+            }
+            for data in sample_crypto_data
+        ],
+    )
 
     await test_session.commit()
 
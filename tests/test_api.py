@@ -12,23 +12,51 @@ from datetime import datetime, timezone
 import pytest
 from httpx import AsyncClient
 
+from app.core.config import settings
 from app.db.models import DataSource, ETLJob, ETLStatus
 
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture(params=["", "/api/v1"], ids=["root", "v1"])
+def api_prefix(request) -> str:
+    """Path prefixes under which the health check is served."""
+    return request.param
+
+
+def _items_of(payload):
+    """Return the row list from a /data payload, bare list or wrapped."""
+    if isinstance(payload, list):
+        return payload
+    return payload.get("data") or payload.get("items") or []
+
+
+@pytest.fixture
+async def data_response(async_client: AsyncClient, seeded_db):
+    """Unfiltered GET /api/v1/data against the seeded database."""
+    return await async_client.get("/api/v1/data")
+
+
 class TestHealthEndpoint:
     """Test /health endpoint."""
 
-    async def test_health_returns_ok(self, async_client: AsyncClient):
+    async def test_health_returns_ok(self, async_client: AsyncClient, api_prefix: str):
         """Health endpoint should return 200 with status healthy."""
-        response = await async_client.get("/health")
+        response = await async_client.get(f"{api_prefix}/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert "timestamp" in data
 
+    async def test_health_timestamp_is_cached_iso(self, async_client: AsyncClient):
+        """Cached health timestamps are tz-aware ISO strings and never go backwards."""
+        first = (await async_client.get("/health")).json()["timestamp"]
+        second = (await async_client.get("/health")).json()["timestamp"]
+
+        assert datetime.fromisoformat(first).tzinfo is not None
+        assert datetime.fromisoformat(second) >= datetime.fromisoformat(first)
+
     async def test_health_includes_db_status(self, async_client: AsyncClient):
         """Health endpoint should include database connectivity status."""
         response = await async_client.get("/health")
@@ -54,17 +82,13 @@ class TestDataEndpoint:
         if isinstance(data, dict):
             assert "data" in data or "items" in data
 
-    async def test_data_returns_seeded_data(
-        self, async_client: AsyncClient, seeded_db
-    ):
+    async def test_data_returns_seeded_data(self, data_response):
         """Data endpoint should return seeded crypto data."""
-        response = await async_client.get("/api/v1/data")
-
-        assert response.status_code == 200
-        data = response.json()
+        assert data_response.status_code == 200
+        data = data_response.json()
 
         # Handle different response formats
-        items = data if isinstance(data, list) else data.get("data", data.get("items", []))
+        items = _items_of(data)
 
         assert len(items) >= 3  # BTC, ETH, XRP from seeded_db
 
@@ -82,7 +106,7 @@ class TestDataEndpoint:
         assert response.status_code == 200
         data = response.json()
 
-        items = data if isinstance(data, list) else data.get("data", data.get("items", []))
+        items = _items_of(data)
 
         # Should only return BTC
         for item in items:
@@ -107,11 +131,23 @@ class TestDataEndpoint:
         assert response.status_code == 200
         data = response.json()
 
-        items = data if isinstance(data, list) else data.get("data", data.get("items", []))
+        items = _items_of(data)
 
         # Should return at most 1 item
         assert len(items) <= 1
 
+    async def test_data_fast_serialization_matches_default(
+        self, async_client: AsyncClient, seeded_db, monkeypatch
+    ):
+        """msgspec-encoded /data should carry the same rows and pagination."""
+        default = (await async_client.get("/api/v1/data")).json()
+        monkeypatch.setattr(settings, "fast_serialization", True)
+        fast = (await async_client.get("/api/v1/data")).json()
+
+        assert fast["data"] == default["data"]
+        assert fast["pagination"] == default["pagination"]
+        assert list(fast["metadata"]) == list(default["metadata"])
+
 
 class TestStatsEndpoint:
     """Test /api/v1/stats endpoint."""
@@ -136,6 +172,62 @@ class TestStatsEndpoint:
         assert stats_response.status_code == 200
         assert data_response.status_code == 200
 
+    async def test_stats_sources_are_source_names(
+        self, async_client: AsyncClient, seeded_db
+    ):
+        """Per-symbol and active sources should be DataSource values."""
+        response = await async_client.get("/api/v1/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        valid = {s.value for s in DataSource}
+
+        assert set(data["sources_active"]) == valid
+        for stats in data["symbol_stats"]:
+            assert "csv" in stats["sources"]
+            assert set(stats["sources"]) <= valid
+
+    async def test_stats_etl_aggregates(
+        self, async_client: AsyncClient, test_session
+    ):
+        """ETL stats should count jobs by status and sum processed records."""
+        test_session.add_all([
+            ETLJob(
+                source=DataSource.CSV,
+                status=ETLStatus.SUCCESS,
+                records_processed=10,
+                started_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+                completed_at=datetime(2024, 1, 15, 12, 5, tzinfo=timezone.utc),
+            ),
+            ETLJob(
+                source=DataSource.COINGECKO,
+                status=ETLStatus.FAILURE,
+                records_processed=0,
+                started_at=datetime(2024, 1, 16, 12, 0, tzinfo=timezone.utc),
+                completed_at=datetime(2024, 1, 16, 12, 1, tzinfo=timezone.utc),
+            ),
+            ETLJob(
+                source=DataSource.CSV,
+                status=ETLStatus.SUCCESS,
+                records_processed=15,
+                started_at=datetime(2024, 1, 17, 12, 0, tzinfo=timezone.utc),
+                completed_at=datetime(2024, 1, 17, 12, 2, tzinfo=timezone.utc),
+            ),
+        ])
+        await test_session.commit()
+
+        response = await async_client.get("/api/v1/stats")
+
+        assert response.status_code == 200
+        etl_stats = response.json()["etl_stats"]
+        assert etl_stats["total_jobs"] == 3
+        assert etl_stats["successful_jobs"] == 2
+        assert etl_stats["failed_jobs"] == 1
+        assert etl_stats["total_records_processed"] == 25
+        assert etl_stats["last_success_at"].startswith("2024-01-17T12:02")
+        assert etl_stats["last_failure_at"].startswith("2024-01-16T12:01")
+        assert etl_stats["last_job_duration_seconds"] == 120.0
+
 
 class TestMetricsEndpoint:
     """Test metrics endpoint (if available)."""
@@ -190,10 +282,10 @@ class TestRunCompareEndpoint:
             completed_at=datetime(2024, 1, 16, 12, 5, tzinfo=timezone.utc),
         )
 
+        # ids are autoincrement; a flush populates them in one round-trip and
+        # the rows are visible to the API session on the shared connection.
         test_session.add_all([job1, job2])
-        await test_session.commit()
-        await test_session.refresh(job1)
-        await test_session.refresh(job2)
+        await test_session.flush()
 
         # Call with run_id params
         response = await async_client.get(
@@ -225,6 +317,16 @@ class TestErrorHandling:
         # Should return validation error or use default
         assert response.status_code in [200, 400, 422]
 
+    @pytest.mark.parametrize(
+        "params", [{"limit": 501}, {"limit": 0}, {"offset": -1}],
+        ids=["limit_501", "limit_0", "offset_negative"],
+    )
+    async def test_out_of_range_paging_is_rejected(self, async_client: AsyncClient, params):
+        """Out-of-range paging values should be a 422, not silently clamped."""
+        response = await async_client.get("/api/v1/data", params=params)
+
+        assert response.status_code == 422
+
     async def test_malformed_request_handling(self, async_client: AsyncClient):
         """Malformed requests should return appropriate error."""
         # Send invalid JSON to an endpoint that expects JSON body
@@ -265,20 +367,16 @@ class TestResponseFormat:
         assert response.status_code == 200
         assert "application/json" in response.headers.get("content-type", "")
 
-    async def test_timestamps_are_iso_format(
-        self, async_client: AsyncClient, seeded_db
-    ):
+    async def test_timestamps_are_iso_format(self, data_response):
         """Timestamps should be in ISO format."""
-        response = await async_client.get("/api/v1/data")
-
-        assert response.status_code == 200
-        data = response.json()
+        assert data_response.status_code == 200
+        data = data_response.json()
 
-        items = data if isinstance(data, list) else data.get("data", data.get("items", []))
+        items = _items_of(data)
 
-        if items:
-            # Check timestamp format if present
-            item = items[0]
+        # Should be ISO format strings; fromisoformat (C-implemented on
+        # 3.11) accepts a trailing "Z" and raises ValueError otherwise
+        for item in items:
             if "timestamp" in item:
-                # Should be ISO format string
                 assert isinstance(item["timestamp"], str)
+                datetime.fromisoformat(item["timestamp"])
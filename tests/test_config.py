@@ -1,6 +1,11 @@
 """Tests for configuration settings."""
 
-from app.core.config import Settings, get_settings
+import pytest
+
+from app.core import config
+from app.core.config import Settings, get_settings, reload_settings
+
+pytestmark = pytest.mark.unit
 
 
 class TestSettings:
@@ -22,3 +27,13 @@ class TestSettings:
         s1 = get_settings()
         s2 = get_settings()
         assert s1 is s2
+
+    def test_reload_settings(self, monkeypatch):
+        # Restore the shared instance when the test finishes
+        monkeypatch.setattr(config, "settings", get_settings())
+        monkeypatch.setenv("BATCH_SIZE", "7")
+
+        reloaded = reload_settings()
+
+        assert reloaded.batch_size == 7
+        assert get_settings() is reloaded
@@ -1,8 +1,11 @@
 import pandas as pd
+import pytest
 
 from app.ingestion.drift import DriftDetector, DriftSeverity
 from app.ingestion.normalization import SymbolNormalizer
 
+pytestmark = pytest.mark.unit
+
 
 def test_drift_detection_schema():
     detector = DriftDetector(expected_columns=["col1", "col2"])
@@ -15,10 +15,12 @@ This addresses MODULE 2 evaluation criteria:
 - Scalable architecture
 """
 
-from datetime import datetime, timezone
+import functools
+from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import distinct, func, insert, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 
 from app.db.models import (
     Coin,
@@ -27,13 +29,26 @@ from app.db.models import (
     UnifiedCryptoData,
 )
 from app.ingestion.asset_resolver import AssetResolver
+from app.ingestion.service import ETLService
 
-pytestmark = pytest.mark.asyncio
+
+@functools.cache
+def _column_names(model) -> frozenset[str]:
+    """Column names of a mapped model's table."""
+    return frozenset(c.name for c in model.__table__.columns)
+
+
+@functools.cache
+def _fk_targets(model) -> frozenset[str]:
+    """Fully qualified targets ("table.column") of a model's foreign keys."""
+    return frozenset(fk.target_fullname for fk in model.__table__.foreign_keys)
 
 
 class TestCoinMasterEntity:
     """Test Coin as the canonical master entity."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_coin_is_system_owned_identity(self, db_session):
         """Verify Coin provides system-owned canonical identity."""
         # Create a canonical Coin entity
@@ -43,8 +58,7 @@ class TestCoinMasterEntity:
             slug="bitcoin",
         )
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         # Coin has system-generated ID (not source-dependent)
         assert coin.id is not None
@@ -60,10 +74,11 @@ class TestCoinMasterEntity:
 
         # Attempt to create duplicate slug should fail
         coin2 = Coin(symbol="BTC", name="Bitcoin Clone", slug="bitcoin")
-        db_session.add(coin2)
 
-        with pytest.raises(Exception):  # IntegrityError
-            await db_session.commit()
+        # Only the savepoint rolls back; the test transaction stays usable
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                db_session.add(coin2)
 
     async def test_coin_independent_of_source(self, db_session):
         """Verify Coin entity is source-agnostic."""
@@ -73,9 +88,8 @@ class TestCoinMasterEntity:
         await db_session.commit()
 
         # Coin exists independently of any data source
-        query = select(Coin).where(Coin.slug == "ethereum")
-        result = await db_session.execute(query)
-        fetched = result.scalar_one()
+        query = select(Coin.symbol, Coin.name).where(Coin.slug == "ethereum")
+        fetched = (await db_session.execute(query)).one()
 
         assert fetched.symbol == "ETH"
         assert fetched.name == "Ethereum"
@@ -84,13 +98,14 @@ class TestCoinMasterEntity:
 class TestSourceAssetMapping:
     """Test SourceAssetMapping links source IDs to canonical Coin."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_mapping_links_source_to_coin(self, db_session):
         """Verify mapping connects source-specific ID to canonical Coin."""
         # Create canonical Coin
         coin = Coin(symbol="BTC", name="Bitcoin", slug="bitcoin")
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         # Create source mapping
         mapping = SourceAssetMapping(
@@ -113,51 +128,44 @@ class TestSourceAssetMapping:
         # Create canonical Coin
         coin = Coin(symbol="BTC", name="Bitcoin", slug="bitcoin")
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         # Create mappings from different sources
-        mappings = [
-            SourceAssetMapping(
-                coin_id=coin.id,
-                source=DataSource.COINGECKO,
-                source_id="bitcoin",
-                source_symbol="btc",
-            ),
-            SourceAssetMapping(
-                coin_id=coin.id,
-                source=DataSource.COINPAPRIKA,
-                source_id="btc-bitcoin",
-                source_symbol="BTC",
-            ),
-            SourceAssetMapping(
-                coin_id=coin.id,
-                source=DataSource.CSV,
-                source_id="BTC",
-                source_symbol="BTC",
-            ),
-        ]
-        for m in mappings:
-            db_session.add(m)
+        await ETLService().bulk_load(db_session, model=SourceAssetMapping, rows=[
+            {
+                "coin_id": coin.id,
+                "source": DataSource.COINGECKO,
+                "source_id": "bitcoin",
+                "source_symbol": "btc",
+            },
+            {
+                "coin_id": coin.id,
+                "source": DataSource.COINPAPRIKA,
+                "source_id": "btc-bitcoin",
+                "source_symbol": "BTC",
+            },
+            {
+                "coin_id": coin.id,
+                "source": DataSource.CSV,
+                "source_id": "BTC",
+                "source_symbol": "BTC",
+            },
+        ])
         await db_session.commit()
 
-        # Query all mappings for this coin
-        query = select(SourceAssetMapping).where(
+        # Distinct sources mapped to this coin, deduplicated in SQL
+        query = select(SourceAssetMapping.source).where(
             SourceAssetMapping.coin_id == coin.id
-        )
-        result = await db_session.execute(query)
-        fetched_mappings = result.scalars().all()
+        ).distinct()
+        sources = set(await db_session.scalars(query))
 
-        assert len(fetched_mappings) == 3
-        sources = {m.source for m in fetched_mappings}
         assert sources == {DataSource.COINGECKO, DataSource.COINPAPRIKA, DataSource.CSV}
 
     async def test_unique_source_source_id_constraint(self, db_session):
         """Verify source+source_id combination is unique."""
         coin = Coin(symbol="BTC", name="Bitcoin", slug="bitcoin")
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         mapping1 = SourceAssetMapping(
             coin_id=coin.id,
@@ -175,19 +183,19 @@ class TestSourceAssetMapping:
             source_id="bitcoin",  # Same source_id
             source_symbol="BTC",
         )
-        db_session.add(mapping2)
 
-        with pytest.raises(Exception):  # IntegrityError
-            await db_session.commit()
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                db_session.add(mapping2)
 
 
 class TestAssetResolver:
     """Test AssetResolver creates and retrieves canonical entities."""
 
-    async def test_resolver_creates_new_coin(self, db_session):
-        """Verify resolver creates new Coin for unknown asset."""
-        resolver = AssetResolver()
+    pytestmark = pytest.mark.asyncio
 
+    async def test_resolver_creates_new_coin(self, resolver, db_session):
+        """Verify resolver creates new Coin for unknown asset."""
         coin_id = await resolver.resolve_asset(
             session=db_session,
             source=DataSource.COINGECKO,
@@ -201,16 +209,12 @@ class TestAssetResolver:
         assert isinstance(coin_id, int)
 
         # Coin should exist in database
-        query = select(Coin).where(Coin.id == coin_id)
-        result = await db_session.execute(query)
-        coin = result.scalar_one()
+        symbol = await db_session.scalar(select(Coin.symbol).where(Coin.id == coin_id))
 
-        assert coin.symbol == "BTC"  # Normalized to uppercase
+        assert symbol == "BTC"  # Normalized to uppercase
 
-    async def test_resolver_creates_mapping(self, db_session):
+    async def test_resolver_creates_mapping(self, resolver, db_session):
         """Verify resolver creates SourceAssetMapping."""
-        resolver = AssetResolver()
-
         coin_id = await resolver.resolve_asset(
             session=db_session,
             source=DataSource.COINPAPRIKA,
@@ -220,20 +224,19 @@ class TestAssetResolver:
         )
 
         # Mapping should exist
-        query = select(SourceAssetMapping).where(
+        query = select(
+            SourceAssetMapping.coin_id, SourceAssetMapping.source_symbol
+        ).where(
             SourceAssetMapping.source == DataSource.COINPAPRIKA,
             SourceAssetMapping.source_id == "btc-bitcoin",
         )
-        result = await db_session.execute(query)
-        mapping = result.scalar_one()
+        mapping = (await db_session.execute(query)).one()
 
         assert mapping.coin_id == coin_id
         assert mapping.source_symbol == "BTC"
 
-    async def test_resolver_reuses_existing_coin(self, db_session):
+    async def test_resolver_reuses_existing_coin(self, resolver, db_session):
         """Verify resolver returns existing coin_id for known asset."""
-        resolver = AssetResolver()
-
         # First resolution creates the coin
         coin_id_1 = await resolver.resolve_asset(
             session=db_session,
@@ -252,7 +255,7 @@ class TestAssetResolver:
 
         assert coin_id_1 == coin_id_2
 
-    async def test_cross_source_disambiguation(self, db_session):
+    async def test_cross_source_disambiguation(self, resolver, db_session):
         """
         Test that same asset from different sources maps to same Coin.
 
@@ -260,8 +263,6 @@ class TestAssetResolver:
         Different sources using different IDs for the same asset
         should resolve to the same canonical Coin entity.
         """
-        resolver = AssetResolver()
-
         # CoinGecko uses "bitcoin" as source_id
         coin_id_coingecko = await resolver.resolve_asset(
             session=db_session,
@@ -293,23 +294,77 @@ class TestAssetResolver:
         assert coin_id_coingecko == coin_id_coinpaprika == coin_id_csv
 
         # Verify only ONE Coin was created
-        query = select(Coin).where(Coin.symbol == "BTC")
-        result = await db_session.execute(query)
-        coins = result.scalars().all()
-        assert len(coins) == 1
+        coin_count = await db_session.scalar(
+            select(func.count()).select_from(Coin).where(Coin.symbol == "BTC")
+        )
+        assert coin_count == 1
 
         # But THREE mappings should exist
-        mapping_query = select(SourceAssetMapping).where(
-            SourceAssetMapping.coin_id == coin_id_coingecko
+        mapping_count = await db_session.scalar(
+            select(func.count())
+            .select_from(SourceAssetMapping)
+            .where(SourceAssetMapping.coin_id == coin_id_coingecko)
         )
-        result = await db_session.execute(mapping_query)
-        mappings = result.scalars().all()
-        assert len(mappings) == 3
+        assert mapping_count == 3
+
+    async def test_bulk_resolve_matches_single_resolves(self, resolver, db_session):
+        """resolve_assets links cross-source assets like repeated resolve_asset."""
+        assets = [
+            {"source": DataSource.COINGECKO, "source_id": "bitcoin",
+             "source_symbol": "btc", "source_name": "Bitcoin"},
+            {"source": DataSource.COINPAPRIKA, "source_id": "btc-bitcoin",
+             "source_symbol": "BTC", "source_name": "Bitcoin"},
+            {"source": DataSource.COINGECKO, "source_id": "ethereum",
+             "source_symbol": "eth", "source_name": "Ethereum"},
+            {"source": DataSource.COINGECKO, "source_id": "bitcoin",
+             "source_symbol": "btc", "source_name": "Bitcoin"},
+        ]
 
-    async def test_different_assets_get_different_coins(self, db_session):
-        """Verify different assets are assigned different Coin entities."""
-        resolver = AssetResolver()
+        coin_ids = await resolver.resolve_assets(db_session, assets)
+
+        assert coin_ids[0] == coin_ids[1] == coin_ids[3]
+        assert coin_ids[2] != coin_ids[0]
+        assert await db_session.scalar(select(func.count()).select_from(Coin)) == 2
+        assert await db_session.scalar(
+            select(func.count()).select_from(SourceAssetMapping)
+        ) == 3
 
+        # Known keys are served from the cache and agree with resolve_asset
+        assert await resolver.resolve_asset(
+            session=db_session,
+            source=DataSource.CSV,
+            source_id="BTC",
+            source_symbol="BTC",
+        ) == coin_ids[0]
+
+    async def test_independent_resolvers_agree(self, resolver, db_session):
+        """Resolvers with separate caches (e.g. two ETL workers) share one Coin and mapping."""
+        coin_ids = [
+            await r.resolve_asset(
+                session=db_session,
+                source=DataSource.COINGECKO,
+                source_id="bitcoin",
+                source_symbol="btc",
+                source_name="Bitcoin",
+            )
+            for r in (resolver, AssetResolver(), AssetResolver())
+        ]
+
+        assert len(set(coin_ids)) == 1
+        coin_count = await db_session.scalar(
+            select(func.count()).select_from(Coin).where(Coin.symbol == "BTC")
+        )
+        assert coin_count == 1
+        mapping_count = await db_session.scalar(
+            select(func.count()).select_from(SourceAssetMapping).where(
+                SourceAssetMapping.source == DataSource.COINGECKO,
+                SourceAssetMapping.source_id == "bitcoin",
+            )
+        )
+        assert mapping_count == 1
+
+    async def test_different_assets_get_different_coins(self, resolver, db_session):
+        """Verify different assets are assigned different Coin entities."""
         btc_id = await resolver.resolve_asset(
             session=db_session,
             source=DataSource.COINGECKO,
@@ -330,22 +385,21 @@ class TestAssetResolver:
         assert btc_id != eth_id
 
         # Two Coins should exist
-        query = select(Coin)
-        result = await db_session.execute(query)
-        coins = result.scalars().all()
-        assert len(coins) == 2
+        coin_count = await db_session.scalar(select(func.count()).select_from(Coin))
+        assert coin_count == 2
 
 
 class TestUnifiedCryptoDataWithCoinId:
     """Test UnifiedCryptoData uses coin_id for proper normalization."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_price_data_references_coin_id(self, db_session):
         """Verify price data uses coin_id as primary identifier."""
         # Create canonical Coin
         coin = Coin(symbol="BTC", name="Bitcoin", slug="bitcoin")
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         # Create price data referencing coin_id
         price_data = UnifiedCryptoData(
@@ -373,44 +427,47 @@ class TestUnifiedCryptoDataWithCoinId:
         # Create canonical Coin
         coin = Coin(symbol="BTC", name="Bitcoin", slug="bitcoin")
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         timestamp = datetime.now(timezone.utc)
 
-        # Price data from different sources for same coin
-        data_points = [
-            UnifiedCryptoData(
-                coin_id=coin.id,
-                symbol="BTC",
-                price_usd=50000.0,
-                source=DataSource.COINGECKO,
-                timestamp=timestamp,
-            ),
-            # Note: Different source, same coin_id - this is allowed
-            # because unique constraint is on (coin_id, source, timestamp)
-        ]
-
-        for dp in data_points:
-            db_session.add(dp)
-        await db_session.commit()
-
-        # Query by coin_id aggregates all sources
-        query = select(UnifiedCryptoData).where(
-            UnifiedCryptoData.coin_id == coin.id
+        # Price data from different sources for same coin (timestamps
+        # differ because (symbol, timestamp) is also unique)
+        await db_session.execute(
+            insert(UnifiedCryptoData),
+            [
+                {
+                    "coin_id": coin.id,
+                    "symbol": "BTC",
+                    "price_usd": price,
+                    "source": source,
+                    "timestamp": timestamp + timedelta(seconds=offset),
+                }
+                for offset, (source, price) in enumerate((
+                    (DataSource.COINGECKO, 50000.0),
+                    (DataSource.COINPAPRIKA, 50100.0),
+                ))
+            ],
         )
-        result = await db_session.execute(query)
-        records = result.scalars().all()
 
-        assert len(records) >= 1
-        assert all(r.coin_id == coin.id for r in records)
+        # Aggregate by coin_id in the database, across all sources
+        coin_id = coin.id
+        query = lambda_stmt(lambda: select(
+            func.count(),
+            func.count(distinct(UnifiedCryptoData.source)),
+            func.avg(UnifiedCryptoData.price_usd),
+        ).where(UnifiedCryptoData.coin_id == coin_id))
+        rows, sources, avg_price = (await db_session.execute(query)).one()
+
+        assert rows == 2
+        assert sources == 2
+        assert float(avg_price) == pytest.approx(50050.0)
 
     async def test_coin_relationship_navigation(self, db_session):
         """Test relationship navigation from price data to Coin."""
         coin = Coin(symbol="ETH", name="Ethereum", slug="ethereum")
         db_session.add(coin)
-        await db_session.commit()
-        await db_session.refresh(coin)
+        await db_session.flush()
 
         price_data = UnifiedCryptoData(
             coin_id=coin.id,
@@ -420,8 +477,7 @@ class TestUnifiedCryptoDataWithCoinId:
             timestamp=datetime.now(timezone.utc),
         )
         db_session.add(price_data)
-        await db_session.commit()
-        await db_session.refresh(price_data)
+        await db_session.flush()
 
         # Navigate from price data to canonical Coin
         assert price_data.coin is not None
@@ -432,7 +488,9 @@ class TestUnifiedCryptoDataWithCoinId:
 class TestEndToEndEntityNormalization:
     """End-to-end tests for complete normalization workflow."""
 
-    async def test_full_etl_creates_canonical_entities(self, db_session):
+    pytestmark = pytest.mark.asyncio
+
+    async def test_full_etl_creates_canonical_entities(self, resolver, db_session):
         """
         Test that full ETL workflow creates proper canonical entities.
 
@@ -441,8 +499,6 @@ class TestEndToEndEntityNormalization:
         2. Price data references coin_id
         3. Cross-source data for same asset uses same coin_id
         """
-        resolver = AssetResolver()
-
         # Simulate CoinGecko data arrival
         btc_coin_id = await resolver.resolve_asset(
             session=db_session,
@@ -488,43 +544,40 @@ class TestEndToEndEntityNormalization:
         await db_session.commit()
 
         # Query all BTC price data by coin_id
-        query = select(UnifiedCryptoData).where(
+        query = lambda_stmt(lambda: select(UnifiedCryptoData.source).where(
             UnifiedCryptoData.coin_id == btc_coin_id
-        )
-        result = await db_session.execute(query)
-        all_btc_prices = result.scalars().all()
+        ))
+        sources = (await db_session.scalars(query)).all()
 
         # Both sources' data is aggregated under same coin_id
-        assert len(all_btc_prices) == 2
-        sources = {p.source for p in all_btc_prices}
-        assert sources == {DataSource.COINGECKO, DataSource.COINPAPRIKA}
+        assert len(sources) == 2
+        assert set(sources) == {DataSource.COINGECKO, DataSource.COINPAPRIKA}
 
-    async def test_symbol_collision_resolved_by_coin_id(self, db_session):
+    async def test_symbol_collision_resolved_by_coin_id(self, resolver, db_session):
         """
         Test that symbol collisions are resolved via coin_id.
 
         In edge cases, different assets might share symbols across sources.
         coin_id ensures proper disambiguation.
         """
-        resolver = AssetResolver()
-
-        # First asset: "ATOM" from CoinGecko (Cosmos)
-        atom_cosmos_id = await resolver.resolve_asset(
-            session=db_session,
-            source=DataSource.COINGECKO,
-            source_id="cosmos",
-            source_symbol="atom",
-            source_name="Cosmos Hub",
-        )
-
-        # Second occurrence with same symbol should still work
-        # because we track by (source, source_id) not just symbol
-        atom_cosmos_id_2 = await resolver.resolve_asset(
-            session=db_session,
-            source=DataSource.COINPAPRIKA,
-            source_id="atom-cosmos",
-            source_symbol="ATOM",
-            source_name="Cosmos",
+        # "ATOM" from CoinGecko (Cosmos), then a second occurrence with the
+        # same symbol; this works because we track by (source, source_id)
+        atom_cosmos_id, atom_cosmos_id_2 = await resolver.resolve_assets(
+            db_session,
+            [
+                {
+                    "source": DataSource.COINGECKO,
+                    "source_id": "cosmos",
+                    "source_symbol": "atom",
+                    "source_name": "Cosmos Hub",
+                },
+                {
+                    "source": DataSource.COINPAPRIKA,
+                    "source_id": "atom-cosmos",
+                    "source_symbol": "ATOM",
+                    "source_name": "Cosmos",
+                },
+            ],
         )
 
         # Same underlying asset, same coin_id
@@ -534,22 +587,21 @@ class TestEndToEndEntityNormalization:
 class TestNormalizationArchitecture:
     """Tests validating architectural requirements for MODULE 2."""
 
+    pytestmark = pytest.mark.unit
+
     def test_coin_entity_has_required_fields(self):
         """Verify Coin entity has all required canonical identity fields."""
-        columns = {c.name for c in Coin.__table__.columns}
         required = {"id", "symbol", "name", "slug"}
-        assert required.issubset(columns)
+        assert required <= _column_names(Coin)
 
     def test_source_mapping_has_required_fields(self):
         """Verify SourceAssetMapping has fields for disambiguation."""
-        columns = {c.name for c in SourceAssetMapping.__table__.columns}
         required = {"id", "coin_id", "source", "source_id", "source_symbol"}
-        assert required.issubset(columns)
+        assert required <= _column_names(SourceAssetMapping)
 
     def test_unified_data_has_coin_id_fk(self):
         """Verify UnifiedCryptoData references Coin via foreign key."""
-        fk_targets = [fk.target_fullname for fk in UnifiedCryptoData.__table__.foreign_keys]
-        assert "coins.id" in fk_targets
+        assert "coins.id" in _fk_targets(UnifiedCryptoData)
 
     def test_coin_id_is_primary_identifier(self):
         """Verify coin_id is part of unique constraint for deduplication."""
@@ -8,244 +8,317 @@ Tests:
 4. Partial data recovery
 """
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
+import httpx
 import pytest
+from sqlalchemy import func, insert, select, update
 
+from app.core.exceptions import APIException, ExtractionException
 from app.db.models import DataSource, ETLJob, ETLStatus, UnifiedCryptoData
 from app.ingestion.extractors.coingecko import CoinGeckoExtractor
 from app.ingestion.extractors.coinpaprika import CoinPaprikaExtractor
 from app.ingestion.extractors.csv_extractor import CSVExtractor
+from app.ingestion.service import ETLService
+from app.schemas.crypto import UnifiedCryptoDataCreate
 
 pytestmark = pytest.mark.asyncio
 
 
-class TestETLFailureInjection:
-    """Test ETL behavior under failure conditions."""
-
-    async def test_etl_failure_mid_batch_sets_failed_status(self, db_session):
-        """When ETL fails mid-batch, job status should be FAILURE."""
-        # Create ETL job
-        job = ETLJob(
-            source=DataSource.CSV,
-            status=ETLStatus.RUNNING,
-            records_processed=0,
-            started_at=datetime.now(timezone.utc),
-        )
-        db_session.add(job)
-        await db_session.commit()
-        await db_session.refresh(job)
+def _rows(source: DataSource, data) -> list[dict]:
+    """UnifiedCryptoData insert parameters for sample rows from one source."""
+    return [{**crypto, "source": source} for crypto in data]
 
-        # Simulate failure by updating status
-        job.status = ETLStatus.FAILURE
-        job.error_message = "Simulated mid-batch failure"
-        await db_session.commit()
-        await db_session.refresh(job)
 
-        assert job.status == ETLStatus.FAILURE
-        assert job.error_message is not None
+class TestETLFailureInjection:
+    """Test ETL behavior under failure conditions."""
 
     async def test_etl_retry_after_failure_succeeds(self, db_session):
         """After a failure, retry should succeed and update status."""
-        # Create a failed job
-        failed_job = ETLJob(
-            source=DataSource.CSV,
-            status=ETLStatus.FAILURE,
-            records_processed=5,
-            started_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
-            completed_at=datetime(2024, 1, 15, 0, 5, tzinfo=timezone.utc),
-            error_message="Connection timeout",
-        )
-        db_session.add(failed_job)
-        await db_session.commit()
-
-        # Create a new successful retry job
-        retry_job = ETLJob(
-            source=DataSource.CSV,
-            status=ETLStatus.SUCCESS,
-            records_processed=10,
-            started_at=datetime(2024, 1, 16, tzinfo=timezone.utc),
-            completed_at=datetime(2024, 1, 16, 0, 5, tzinfo=timezone.utc),
+        # Create the failed job and its successful retry in one statement
+        result = await db_session.execute(
+            insert(ETLJob).returning(
+                ETLJob.status, ETLJob.records_processed, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "source": DataSource.CSV,
+                    "status": ETLStatus.FAILURE,
+                    "records_processed": 5,
+                    "started_at": datetime(2024, 1, 15, tzinfo=timezone.utc),
+                    "completed_at": datetime(2024, 1, 15, 0, 5, tzinfo=timezone.utc),
+                    "error_message": "Connection timeout",
+                },
+                {
+                    "source": DataSource.CSV,
+                    "status": ETLStatus.SUCCESS,
+                    "records_processed": 10,
+                    "started_at": datetime(2024, 1, 16, tzinfo=timezone.utc),
+                    "completed_at": datetime(2024, 1, 16, 0, 5, tzinfo=timezone.utc),
+                },
+            ],
         )
-        db_session.add(retry_job)
-        await db_session.commit()
-        await db_session.refresh(retry_job)
+        _, retry_job = result.all()
 
         assert retry_job.status == ETLStatus.SUCCESS
         assert retry_job.records_processed == 10
 
     async def test_idempotency_prevents_duplicate_records(self, db_session, sample_crypto_data):
         """Re-running ETL should not create duplicate records."""
-        # Insert initial data
-        for crypto in sample_crypto_data:
-            record = UnifiedCryptoData(
-                symbol=crypto["symbol"],
-                price_usd=crypto["price_usd"],
-                market_cap=crypto.get("market_cap"),
-                volume_24h=crypto.get("volume_24h"),
-                source=DataSource.CSV,
-                timestamp=crypto["timestamp"],
-            )
-            db_session.add(record)
-        await db_session.commit()
-
-        # Count records
-        from sqlalchemy import func, select
-        count_query = select(func.count()).select_from(UnifiedCryptoData)
-        result = await db_session.execute(count_query)
-        initial_count = result.scalar()
+        records = [
+            UnifiedCryptoDataCreate(**crypto, source=DataSource.CSV)
+            for crypto in sample_crypto_data
+        ]
+        raw_data = [dict(crypto) for crypto in sample_crypto_data]
+        service = ETLService()
+        count_rows = select(func.count()).select_from(UnifiedCryptoData)
+
+        # Initial run, then a re-run of the same batch through the production
+        # upsert (ON CONFLICT on uq_coin_source_timestamp)
+        await service.resolve_and_upsert_unified_data(
+            db_session, records, raw_data, DataSource.CSV
+        )
+        first_count = await db_session.scalar(count_rows)
+        await service.resolve_and_upsert_unified_data(
+            db_session, records, raw_data, DataSource.CSV
+        )
+        rerun_count = await db_session.scalar(count_rows)
 
-        assert initial_count == len(sample_crypto_data)
+        assert first_count == len(sample_crypto_data)
+        assert rerun_count == first_count
 
 
 class TestETLNetworkResilience:
     """Test ETL resilience to network issues."""
 
-    async def test_network_timeout_handling(self, db_session):
-        """ETL should handle network timeouts gracefully."""
-        job = ETLJob(
-            source=DataSource.COINGECKO,
-            status=ETLStatus.RUNNING,
-            records_processed=0,
-            started_at=datetime.now(timezone.utc),
-        )
-        db_session.add(job)
-        await db_session.commit()
-
-        # Simulate timeout -> failure
-        job.status = ETLStatus.FAILURE
-        job.error_message = "Network timeout after 30s"
-        await db_session.commit()
-        await db_session.refresh(job)
-
-        assert job.status == ETLStatus.FAILURE
-        assert "timeout" in job.error_message.lower()
-
     async def test_partial_batch_recovery(self, db_session, sample_crypto_data):
         """ETL should handle partial batch success."""
         # Insert partial data (simulate partial success)
         partial_data = sample_crypto_data[:2]  # Only first 2 records
 
-        for crypto in partial_data:
-            record = UnifiedCryptoData(
-                symbol=crypto["symbol"],
-                price_usd=crypto["price_usd"],
-                market_cap=crypto.get("market_cap"),
-                volume_24h=crypto.get("volume_24h"),
-                source=DataSource.CSV,
-                timestamp=crypto["timestamp"],
+        # The partial rows and the failed job recording them commit atomically
+        async with db_session.begin():
+            loaded = await ETLService().bulk_load(
+                db_session, _rows(DataSource.CSV, partial_data)
             )
-            db_session.add(record)
-        await db_session.commit()
+            job = (
+                await db_session.execute(
+                    insert(ETLJob)
+                    .values(
+                        source=DataSource.CSV,
+                        status=ETLStatus.FAILURE,
+                        records_processed=loaded,
+                        started_at=datetime(2024, 1, 15, tzinfo=timezone.utc),
+                        error_message="Simulated failure after partial batch",
+                    )
+                    .returning(ETLJob.status, ETLJob.records_processed)
+                )
+            ).one()
+
+        assert loaded == 2
+        assert job.status == ETLStatus.FAILURE
+        assert job.records_processed == loaded
+
+    @pytest.mark.parametrize(
+        "mutate,match",
+        [
+            (lambda row: row.pop("price_usd"), "same keys"),
+            (lambda row: row.update(not_a_column=1), "same keys"),
+        ],
+        ids=["missing_key", "extra_key"],
+    )
+    async def test_bulk_load_rejects_ragged_rows(
+        self, db_session, sample_crypto_data, mutate, match
+    ):
+        """bulk_load should refuse rows whose keys differ instead of dropping data."""
+        rows = _rows(DataSource.CSV, sample_crypto_data[:2])
+        mutate(rows[1])
+
+        with pytest.raises(ValueError, match=match):
+            await ETLService().bulk_load(db_session, rows)
+
+    async def test_bulk_load_applies_python_column_defaults(self, db_session):
+        """Omitted columns with a Python-side default get it, as the ORM would."""
+        loaded = await ETLService().bulk_load(
+            db_session,
+            [{"source": DataSource.CSV, "status": ETLStatus.RUNNING}],
+            model=ETLJob,
+        )
+
+        records_processed = await db_session.scalar(select(ETLJob.records_processed))
+        assert loaded == 1
+        assert records_processed == 0
 
-        # Verify partial data exists
-        from sqlalchemy import func, select
-        count_query = select(func.count()).select_from(UnifiedCryptoData)
-        result = await db_session.execute(count_query)
-        count = result.scalar()
+    async def test_bulk_load_rejects_unknown_columns(self, db_session, sample_crypto_data):
+        """Keys that are not table columns should fail before anything is written."""
+        rows = [dict(row, not_a_column=1) for row in _rows(DataSource.CSV, sample_crypto_data)]
 
-        assert count == 2
+        with pytest.raises(ValueError, match="not_a_column"):
+            await ETLService().bulk_load(db_session, rows)
 
 
 class TestETLJobLifecycle:
     """Test ETL job state transitions."""
 
-    async def test_job_state_transitions(self, db_session):
-        """ETL job should transition through states correctly."""
-        # Create job in RUNNING state
-        job = ETLJob(
-            source=DataSource.CSV,
-            status=ETLStatus.RUNNING,
-            records_processed=0,
-            started_at=datetime.now(timezone.utc),
-        )
-        db_session.add(job)
-        await db_session.commit()
-
-        assert job.status == ETLStatus.RUNNING
-
-        # Transition to SUCCESS
-        job.status = ETLStatus.SUCCESS
-        job.records_processed = 100
-        job.completed_at = datetime.now(timezone.utc)
-        await db_session.commit()
-        await db_session.refresh(job)
+    @pytest.mark.parametrize(
+        "source,final_status,error_message,records_processed",
+        [
+            (DataSource.CSV, ETLStatus.FAILURE, "Simulated mid-batch failure", 0),
+            (DataSource.COINGECKO, ETLStatus.FAILURE, "Network timeout after 30s", 0),
+            (DataSource.CSV, ETLStatus.SUCCESS, None, 100),
+        ],
+        ids=["failure-mid-batch", "network-timeout", "success"],
+    )
+    async def test_running_job_transitions(
+        self, db_session, source, final_status, error_message, records_processed
+    ):
+        """A RUNNING job should reach its final state with the matching details."""
+        job_id, status = (
+            await db_session.execute(
+                insert(ETLJob)
+                .values(
+                    source=source,
+                    status=ETLStatus.RUNNING,
+                    records_processed=0,
+                    started_at=datetime.now(timezone.utc),
+                )
+                .returning(ETLJob.id, ETLJob.status)
+            )
+        ).one()
+
+        assert status == ETLStatus.RUNNING
+
+        # Transition and read back the stored values in one statement
+        job = (
+            await db_session.execute(
+                update(ETLJob)
+                .where(ETLJob.id == job_id)
+                .values(
+                    status=final_status,
+                    error_message=error_message,
+                    records_processed=records_processed,
+                    completed_at=datetime.now(timezone.utc),
+                )
+                .returning(ETLJob.status, ETLJob.records_processed, ETLJob.error_message)
+            )
+        ).one()
 
-        assert job.status == ETLStatus.SUCCESS
-        assert job.records_processed == 100
+        assert job.status == final_status
+        assert job.records_processed == records_processed
+        assert job.error_message == error_message
 
     async def test_failed_job_has_error_message(self, db_session):
         """Failed ETL jobs should have error messages."""
-        job = ETLJob(
-            source=DataSource.COINGECKO,
-            status=ETLStatus.FAILURE,
-            records_processed=0,
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
-            error_message="API rate limit exceeded",
-        )
-        db_session.add(job)
-        await db_session.commit()
-        await db_session.refresh(job)
+        now = datetime.now(timezone.utc)
+        job = (
+            await db_session.execute(
+                insert(ETLJob)
+                .values(
+                    source=DataSource.COINGECKO,
+                    status=ETLStatus.FAILURE,
+                    records_processed=0,
+                    started_at=now,
+                    completed_at=now,
+                    error_message="API rate limit exceeded",
+                )
+                .returning(ETLJob.status, ETLJob.error_message)
+            )
+        ).one()
 
         assert job.status == ETLStatus.FAILURE
         assert job.error_message is not None
         assert len(job.error_message) > 0
 
+    async def test_checkpoint_is_per_source_last_success(self, db_session):
+        """Incremental loads resume from the latest successful job of that source."""
+        await db_session.execute(
+            insert(ETLJob),
+            [
+                {
+                    "source": source,
+                    "status": status,
+                    "records_processed": 1,
+                    "started_at": datetime(2024, 1, day, tzinfo=timezone.utc),
+                    "completed_at": datetime(2024, 1, day, 0, 5, tzinfo=timezone.utc),
+                    "last_processed_timestamp": datetime(2024, 1, day, tzinfo=timezone.utc),
+                }
+                for source, status, day in [
+                    (DataSource.CSV, ETLStatus.SUCCESS, 10),
+                    (DataSource.CSV, ETLStatus.FAILURE, 12),
+                    (DataSource.COINGECKO, ETLStatus.SUCCESS, 11),
+                ]
+            ],
+        )
+        service = ETLService()
 
-class TestExtractorFailures:
-    """Test individual extractor failure handling."""
+        # Same cached statement, different bound source
+        csv_checkpoint = await service.get_last_processed_timestamp(db_session, DataSource.CSV)
+        gecko_checkpoint = await service.get_last_processed_timestamp(
+            db_session, DataSource.COINGECKO
+        )
+        paprika_checkpoint = await service.get_last_processed_timestamp(
+            db_session, DataSource.COINPAPRIKA
+        )
+
+        assert csv_checkpoint.day == 10
+        assert gecko_checkpoint.day == 11
+        assert paprika_checkpoint is None
+
+
+class _ErrorClient:
+    """Stand-in for httpx.AsyncClient that answers every GET with one status."""
 
-    async def test_coingecko_api_error_handling(self):
-        """CoinGecko extractor should handle API errors."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 429  # Rate limited
-            mock_response.raise_for_status.side_effect = Exception("Rate limited")
+    def __init__(self, status_code: int):
+        self._response = httpx.Response(
+            status_code, request=httpx.Request("GET", "https://api.test")
+        )
 
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = None
-            mock_client.return_value = mock_client_instance
+    async def get(self, *args, **kwargs) -> httpx.Response:
+        return self._response
 
-            extractor = CoinGeckoExtractor()
+    async def aclose(self) -> None:
+        pass
 
-            with pytest.raises(Exception):
-                await extractor.extract()
 
-    async def test_coinpaprika_api_error_handling(self):
-        """CoinPaprika extractor should handle API errors."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.raise_for_status.side_effect = Exception("Server error")
+@pytest.fixture(
+    params=[
+        (CoinGeckoExtractor, 429, APIException),
+        (CoinPaprikaExtractor, 500, APIException),
+        (CSVExtractor, None, ExtractionException),
+    ],
+    ids=["coingecko-rate-limited", "coinpaprika-server-error", "csv-file-not-found"],
+)
+def failing_extractor(request, monkeypatch):
+    """
+    (extractor, expected exception) for a source that cannot be read: API
+    extractors get a patched httpx client answering with an error status,
+    the CSV extractor points at a missing file.
+    """
+    extractor_cls, status_code, expected_exc = request.param
+    if status_code is None:
+        yield CSVExtractor(file_path="/nonexistent/path/data.csv"), expected_exc
+        return
 
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = None
-            mock_client.return_value = mock_client_instance
+    client = _ErrorClient(status_code)
+    # Keep the retry loop, drop its real backoff sleeps
+    monkeypatch.setattr(extractor_cls, "RATE_LIMIT_DELAY", 0)
 
-            extractor = CoinPaprikaExtractor()
+    with patch("httpx.AsyncClient", new=lambda *args, **kwargs: client):
+        yield extractor_cls(), expected_exc
 
-            with pytest.raises(Exception):
-                await extractor.extract()
 
-    async def test_csv_file_not_found_error(self):
-        """Test CSVExtractor handles missing file gracefully."""
-        extractor = CSVExtractor(file_path="/nonexistent/path/data.csv")
+class TestExtractorFailures:
+    """Test individual extractor failure handling."""
 
-        from app.core.exceptions import ExtractionException
-        with pytest.raises(ExtractionException):
+    async def test_extractor_failure(self, failing_extractor):
+        """Unreadable sources surface a typed error (rate limit, server error, missing file)."""
+        extractor, expected_exc = failing_extractor
+
+        with pytest.raises(expected_exc):
             await extractor.extract()
 
-    async def test_csv_malformed_data_handling(self, tmp_path):
+    async def test_csv_malformed_data_handling(self, malformed_csv):
         """Test CSVExtractor handles malformed CSV gracefully."""
-        # Create malformed CSV
-        malformed_csv = tmp_path / "malformed.csv"
-        malformed_csv.write_text("symbol,price\nBTC,not_a_number\nETH,50000")
-
         extractor = CSVExtractor(file_path=str(malformed_csv))
 
         # Should either handle gracefully or raise appropriate error
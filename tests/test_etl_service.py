@@ -4,8 +4,13 @@
 import pytest
 
 from app.db.models import DataSource
+from app.ingestion.extractors.coingecko import CoinGeckoExtractor
+from app.ingestion.extractors.coinpaprika import CoinPaprikaExtractor
+from app.ingestion.extractors.csv_extractor import CSVExtractor
 from app.ingestion.service import ETLService
 
+pytestmark = pytest.mark.unit
+
 
 class TestETLService:
     """Test ETL service orchestration."""
@@ -13,10 +18,6 @@ class TestETLService:
     def test_get_extractor_returns_correct_type(self):
         service = ETLService()
 
-        from app.ingestion.extractors.coingecko import CoinGeckoExtractor
-        from app.ingestion.extractors.coinpaprika import CoinPaprikaExtractor
-        from app.ingestion.extractors.csv_extractor import CSVExtractor
-
         assert isinstance(service.get_extractor(DataSource.COINPAPRIKA), CoinPaprikaExtractor)
         assert isinstance(service.get_extractor(DataSource.COINGECKO), CoinGeckoExtractor)
         assert isinstance(service.get_extractor(DataSource.CSV), CSVExtractor)
@@ -2,6 +2,8 @@
 
 from datetime import datetime, timezone
 
+import pytest
+
 from app.db.models import DataSource
 from app.ingestion.extractors.coingecko import CoinGeckoExtractor
 from app.ingestion.extractors.coinpaprika import CoinPaprikaExtractor
@@ -12,6 +14,8 @@ from app.ingestion.transformers.schemas import RawCryptoRecord
 class TestRawCryptoRecord:
     """Test data normalization validators."""
 
+    pytestmark = pytest.mark.unit
+
     def test_symbol_normalization(self):
         record = RawCryptoRecord(
             symbol="  btc  ",
@@ -53,10 +57,16 @@ class TestRawCryptoRecord:
         )
         assert record.timestamp.year == 2024
 
+    def test_unparseable_timestamp_raises(self):
+        with pytest.raises(ValueError):
+            RawCryptoRecord(symbol="BTC", timestamp="not-a-date")
+
 
 class TestCoinPaprikaExtractor:
     """Test CoinPaprika extractor normalization."""
 
+    pytestmark = pytest.mark.unit
+
     def test_normalize_valid_data(self):
         extractor = CoinPaprikaExtractor()
         raw_data = [
@@ -103,6 +113,8 @@ class TestCoinPaprikaExtractor:
 class TestCoinGeckoExtractor:
     """Test CoinGecko extractor normalization."""
 
+    pytestmark = pytest.mark.unit
+
     def test_normalize_valid_data(self):
         extractor = CoinGeckoExtractor()
         raw_data = [
@@ -128,6 +140,7 @@ class TestCoinGeckoExtractor:
 class TestCSVExtractor:
     """Test CSV extractor."""
 
+    @pytest.mark.unit
     def test_normalize_valid_data(self):
         extractor = CSVExtractor()
         raw_data = [
@@ -146,6 +159,7 @@ class TestCSVExtractor:
         assert normalized[0].price_usd == 45000.50
         assert normalized[0].source == DataSource.CSV
 
+    @pytest.mark.unit
     def test_normalize_with_column_mapping(self):
         extractor = CSVExtractor()
         raw_data = [
@@ -162,3 +176,68 @@ class TestCSVExtractor:
         assert len(normalized) == 1
         assert normalized[0].symbol == "ETH"
         assert normalized[0].price_usd == 2500.00
+
+    async def test_fetch_data_filters_by_last_processed(self, tmp_path):
+        csv_file = tmp_path / "prices.csv"
+        csv_file.write_text(
+            "Ticker;Price;Vol;Date\n"
+            "btc;45000;10;2024-01-15\n"
+            "eth;2500;20;2024-01-10T00:00:00Z\n"
+            "xrp;1;2;\n"
+        )
+        extractor = CSVExtractor(file_path=str(csv_file))
+
+        records = await extractor.fetch_data(datetime(2024, 1, 12, tzinfo=timezone.utc))
+
+        # Older rows are dropped; rows without a timestamp are kept
+        assert [r["symbol"] for r in records] == ["btc", "xrp"]
+        assert records[0] == {
+            "symbol": "btc", "price_usd": "45000", "volume_24h": "10", "timestamp": "2024-01-15",
+        }
+
+    async def test_fetch_data_keeps_timestamps_the_transformer_rejects(self, tmp_path):
+        csv_file = tmp_path / "prices.csv"
+        csv_file.write_text(
+            "Ticker,Price,Vol,Date\n"
+            "btc,45000,10,01/10/2024\n"
+            "eth,2500,20,10/01/2024\n"
+            "sol,100,5,2024-01-10T00:00:00+05:00\n"
+            "ada,1,1,2024-01-10\n"
+        )
+        extractor = CSVExtractor(file_path=str(csv_file))
+
+        records = await extractor.fetch_data(datetime(2024, 1, 12, tzinfo=timezone.utc))
+
+        # Non-ISO and offset timestamps are not parseable by RawCryptoRecord,
+        # so the checkpoint cannot drop them; only the older ISO row goes
+        assert [r["symbol"] for r in records] == ["btc", "eth", "sol"]
+
+    async def test_fetch_data_handles_trailing_delimiters(self, tmp_path):
+        csv_file = tmp_path / "prices.csv"
+        csv_file.write_text(
+            "ticker,price,vol,date\n"
+            + "".join(f"c{i},0.5,10,2024-01-{i % 28 + 1:02d},\n" for i in range(60))
+        )
+        extractor = CSVExtractor(file_path=str(csv_file))
+
+        records = await extractor.fetch_data()
+
+        # A trailing delimiter must not shift fields into the index
+        assert records[0] == {
+            "symbol": "c0", "price_usd": "0.5", "volume_24h": "10", "timestamp": "2024-01-01",
+        }
+        assert len(extractor.normalize(records)) == 60
+
+    async def test_fetch_data_keeps_rows_with_extra_fields(self, tmp_path):
+        rows = [f"c{i},0.5,10,2024-01-{i % 28 + 1:02d}\n" for i in range(60)]
+        rows[5] = "eth,2500,20,2024-01-16,extra,fields\n"
+        csv_file = tmp_path / "prices.csv"
+        csv_file.write_text("ticker,price,vol,date\n" + "".join(rows))
+        extractor = CSVExtractor(file_path=str(csv_file))
+
+        records = await extractor.fetch_data()
+
+        assert len(records) == 60
+        assert records[5] == {
+            "symbol": "eth", "price_usd": "2500", "volume_24h": "20", "timestamp": "2024-01-16",
+        }
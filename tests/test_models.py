@@ -1,5 +1,7 @@
 """Tests for database models."""
 
+import pytest
+from sqlalchemy import select
 
 from app.db.models import (
     Coin,
@@ -10,11 +12,14 @@ from app.db.models import (
     SourceAssetMapping,
     UnifiedCryptoData,
 )
+from app.ingestion.service import ETLService
 
 
 class TestDataSourceEnum:
     """Test DataSource enumeration."""
 
+    pytestmark = pytest.mark.unit
+
     def test_datasource_values(self):
         assert DataSource.COINPAPRIKA.value == "coinpaprika"
         assert DataSource.COINGECKO.value == "coingecko"
@@ -24,6 +29,8 @@ class TestDataSourceEnum:
 class TestETLStatusEnum:
     """Test ETLStatus enumeration."""
 
+    pytestmark = pytest.mark.unit
+
     def test_etlstatus_values(self):
         assert ETLStatus.SUCCESS.value == "success"
         assert ETLStatus.FAILURE.value == "failure"
@@ -33,6 +40,8 @@ class TestETLStatusEnum:
 class TestCoinModel:
     """Test Coin master entity model structure."""
 
+    pytestmark = pytest.mark.unit
+
     def test_tablename(self):
         assert Coin.__tablename__ == "coins"
 
@@ -45,6 +54,8 @@ class TestCoinModel:
 class TestSourceAssetMappingModel:
     """Test SourceAssetMapping model structure."""
 
+    pytestmark = pytest.mark.unit
+
     def test_tablename(self):
         assert SourceAssetMapping.__tablename__ == "source_asset_mappings"
 
@@ -60,18 +71,43 @@ class TestSourceAssetMappingModel:
 class TestRawDataModel:
     """Test RawData model structure."""
 
+    @pytest.mark.unit
     def test_tablename(self):
         assert RawData.__tablename__ == "raw_data"
 
+    @pytest.mark.unit
     def test_columns_exist(self):
         columns = {c.name for c in RawData.__table__.columns}
         expected = {"id", "source", "payload", "created_at"}
         assert expected == columns
 
+    async def test_payload_round_trip(self, db_session, coingecko_api_response):
+        """JSON payloads survive the orjson column serializer unchanged."""
+        payload = dict(coingecko_api_response[0])
+        raw = RawData(source=DataSource.COINGECKO, payload=payload)
+        db_session.add(raw)
+        await db_session.commit()
+
+        result = await db_session.execute(select(RawData.payload).where(RawData.id == raw.id))
+        assert result.scalar_one() == payload
+
+    async def test_payload_with_big_integer_is_stored(self, db_session):
+        """Integers beyond 64 bits (orjson's limit) must not fail the raw save."""
+        await ETLService().save_raw_data(
+            db_session, DataSource.COINGECKO, [{"id": "token", "total_supply": 10**27}]
+        )
+
+        result = await db_session.execute(
+            select(RawData.payload).where(RawData.source == DataSource.COINGECKO)
+        )
+        assert result.scalar_one()["total_supply"] == pytest.approx(10**27)
+
 
 class TestUnifiedCryptoDataModel:
     """Test UnifiedCryptoData model structure."""
 
+    pytestmark = pytest.mark.unit
+
     def test_tablename(self):
         assert UnifiedCryptoData.__tablename__ == "unified_crypto_data"
 
@@ -92,6 +128,8 @@ class TestUnifiedCryptoDataModel:
 class TestETLJobModel:
     """Test ETLJob model structure."""
 
+    pytestmark = pytest.mark.unit
+
     def test_tablename(self):
         assert ETLJob.__tablename__ == "etl_jobs"
 
@@ -12,13 +12,33 @@ Comprehensive tests for:
 
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
+from sqlalchemy import insert, select
 
+from app.core.middleware import get_structured_logger, metrics_collector
 from app.db.models import DataSource, ETLJob, ETLStatus
+from app.ingestion import drift as drift_module
 from app.ingestion.drift import DriftDetector, DriftSeverity
+from app.ingestion.extractors.coingecko import CoinGeckoExtractor
+from app.ingestion.extractors.coinpaprika import CoinPaprikaExtractor
 
-pytestmark = pytest.mark.asyncio
+
+async def _bulk_add_jobs(db_session, rows: list[dict]) -> list[int]:
+    """Insert ETLJob rows in one executemany statement and return their ids."""
+    result = await db_session.execute(
+        insert(ETLJob).returning(ETLJob.id, sort_by_parameter_order=True), rows
+    )
+    return list(result.scalars())
+
+
+def _hourly_runs(
+    day: str, periods: int, duration: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """(started_at, completed_at) pairs for runs starting hourly from midnight UTC."""
+    starts = pd.date_range(day, periods=periods, freq="h", tz="UTC")
+    return list(zip(starts.to_pydatetime(), (starts + duration).to_pydatetime()))
 
 
 # =============================================================================
@@ -29,12 +49,12 @@ pytestmark = pytest.mark.asyncio
 class TestSchemaDriftDetection:
     """Test schema drift detection with fuzzy matching and confidence scoring."""
 
+    pytestmark = pytest.mark.unit
+
     def test_detect_missing_column(self):
         """Detect completely missing required columns."""
         detector = DriftDetector(expected_columns=["symbol", "price", "timestamp"])
-        df = pd.DataFrame({"symbol": ["BTC"], "price": [50000]})
-
-        results = detector.check_schema(df)
+        results = detector.check_schema_columns(["symbol", "price"])
 
         # Should find missing 'timestamp' column
         missing_results = [r for r in results if r.drift_type == "schema_missing"]
@@ -48,14 +68,8 @@ class TestSchemaDriftDetection:
             expected_columns=["symbol", "price_usd", "volume"],
             fuzzy_match_threshold=0.6,  # Lower threshold to catch more renames
         )
-        # Column "price_usd" renamed to "priceUsd" (similar)
-        df = pd.DataFrame({
-            "symbol": ["BTC"],
-            "priceUsd": [50000],  # CamelCase version
-            "volume": [1000000],
-        })
-
-        results = detector.check_schema(df)
+        # Column "price_usd" renamed to "priceUsd" (CamelCase, similar)
+        results = detector.check_schema_columns(["symbol", "priceUsd", "volume"])
 
         # Should detect potential rename with confidence score
         # May or may not find a match depending on fuzzy threshold
@@ -68,9 +82,7 @@ class TestSchemaDriftDetection:
             expected_columns=["market_capitalization"],
             fuzzy_match_threshold=0.6,
         )
-        df = pd.DataFrame({"market_cap": [1000000000]})
-
-        results = detector.check_schema(df)
+        results = detector.check_schema_columns(["market_cap"])
 
         rename_results = [r for r in results if r.drift_type == "schema_rename"]
         if rename_results:
@@ -79,18 +91,58 @@ class TestSchemaDriftDetection:
             # Similarity score should be in details
             assert "similarity_score" in rename_results[0].details
 
-    def test_detect_extra_columns(self):
-        """Detect extra columns in data (informational)."""
+    def test_rename_picks_most_similar_column(self):
+        """Each missing column is matched to its closest actual column."""
+        detector = DriftDetector(
+            expected_columns=["price_usd", "volume_24h"],
+            fuzzy_match_threshold=0.8,
+        )
+        df = pd.DataFrame({"price_usdt": [1.0], "volume_24": [2.0], "zzz": [3]})
+
+        results = detector.check_schema(df)
+
+        renames = {
+            r.details["expected_column"]: r for r in results if r.drift_type == "schema_rename"
+        }
+        assert renames["price_usd"].details["matched_column"] == "price_usdt"
+        assert renames["volume_24h"].details["matched_column"] == "volume_24"
+        assert renames["price_usd"].confidence == pytest.approx(18 / 19)
+
+    def test_case_only_rename_is_exact(self):
+        """A column differing only in case is a full-confidence rename."""
         detector = DriftDetector(expected_columns=["symbol", "price"])
-        df = pd.DataFrame({
-            "symbol": ["BTC"],
-            "price": [50000],
-            "new_field": ["extra_data"],
-            "another_new": [123],
-        })
+        df = pd.DataFrame({"Symbol": ["BTC"], "price": [50000]})
 
         results = detector.check_schema(df)
 
+        renames = [r for r in results if r.drift_type == "schema_rename"]
+        assert len(renames) == 1
+        assert renames[0].details["matched_column"] == "Symbol"
+        assert renames[0].confidence == 1.0
+
+    def test_repeated_schema_reuses_rename_matches(self, monkeypatch):
+        """Fuzzy scoring runs once per observed schema; results stay fresh."""
+        detector = DriftDetector(expected_columns=["symbol", "price_usd"])
+        calls = []
+        real_cdist = drift_module.process.cdist
+        monkeypatch.setattr(
+            drift_module.process,
+            "cdist",
+            lambda *args, **kwargs: calls.append(args) or real_cdist(*args, **kwargs),
+        )
+
+        first = detector.check_schema_columns(["symbol", "price_usdt"])
+        second = detector.check_schema_columns(["price_usdt", "symbol"])
+
+        assert len(calls) == 1
+        assert [r.details for r in first] == [r.details for r in second]
+        assert detector.get_drift_summary()["total_issues"] == len(first) + len(second)
+
+    def test_detect_extra_columns(self):
+        """Detect extra columns in data (informational)."""
+        detector = DriftDetector(expected_columns=["symbol", "price"])
+        results = detector.check_schema_columns(["symbol", "price", "new_field", "another_new"])
+
         extra_results = [r for r in results if r.drift_type == "schema_extra"]
         assert len(extra_results) == 1
         assert extra_results[0].severity == DriftSeverity.INFO
@@ -104,8 +156,8 @@ class TestSchemaDriftDetection:
         )
         # 50% nulls in price column
         df = pd.DataFrame({
-            "symbol": ["BTC", "ETH", "SOL", "ADA"],
-            "price": [50000, None, None, 3000],
+            "symbol": pd.array(["BTC", "ETH", "SOL", "ADA"], dtype="string"),
+            "price": np.array([50000, np.nan, np.nan, 3000], dtype=np.float64),
         })
 
         results = detector.check_data_quality(df)
@@ -121,8 +173,17 @@ class TestSchemaDriftDetection:
         detector = DriftDetector(expected_columns=["a", "b", "c"])
 
         # Trigger some drift detections
-        df1 = pd.DataFrame({"a": [1], "b": [None]})  # Missing c
-        df2 = pd.DataFrame({"a": [None, None], "b": [1, 2], "c": [3, 4]})  # High nulls in a
+        # Missing c
+        df1 = pd.DataFrame({
+            "a": np.array([1], dtype=np.int64),
+            "b": np.array([np.nan], dtype=np.float64),
+        })
+        # High nulls in a
+        df2 = pd.DataFrame({
+            "a": np.array([np.nan, np.nan], dtype=np.float64),
+            "b": np.array([1, 2], dtype=np.int64),
+            "c": np.array([3, 4], dtype=np.int64),
+        })
 
         detector.check_schema(df1)
         detector.check_data_quality(df2)
@@ -132,6 +193,11 @@ class TestSchemaDriftDetection:
         assert summary["total_issues"] > 0
         assert "by_severity" in summary
         assert "by_type" in summary
+        assert summary["by_type"] == {"schema_missing": 1, "quality_nulls": 1}
+        assert summary["by_severity"] == {"critical": 2}
+
+        detector.clear_history()
+        assert detector.get_drift_summary()["total_issues"] == 0
 
 
 # =============================================================================
@@ -142,6 +208,8 @@ class TestSchemaDriftDetection:
 class TestFailureRecovery:
     """Test ETL failure handling and recovery mechanisms."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_checkpoint_preserves_progress(self, db_session):
         """Failed job should preserve last_processed_timestamp for resume."""
         # Create job that failed mid-processing
@@ -158,14 +226,19 @@ class TestFailureRecovery:
         )
         db_session.add(job)
         await db_session.commit()
-        await db_session.refresh(job)
+
+        # Read back only the persisted progress columns, not the whole row
+        stored = (await db_session.execute(
+            select(ETLJob.last_processed_timestamp, ETLJob.records_processed)
+            .where(ETLJob.id == job.id)
+        )).one()
 
         # Checkpoint should be preserved (compare without timezone for SQLite)
-        assert job.last_processed_timestamp is not None
-        assert job.last_processed_timestamp.year == 2024
-        assert job.last_processed_timestamp.month == 1
-        assert job.last_processed_timestamp.day == 15
-        assert job.records_processed == 50
+        assert stored.last_processed_timestamp is not None
+        assert stored.last_processed_timestamp.year == 2024
+        assert stored.last_processed_timestamp.month == 1
+        assert stored.last_processed_timestamp.day == 15
+        assert stored.records_processed == 50
 
     async def test_retry_resumes_from_checkpoint(self, db_session):
         """Retry should resume from last checkpoint timestamp."""
@@ -225,10 +298,10 @@ class TestFailureRecovery:
 class TestRateLimitingBackoff:
     """Test rate limiting and exponential backoff implementation."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_coingecko_exponential_backoff(self):
         """CoinGecko extractor should implement exponential backoff."""
-        from app.ingestion.extractors.coingecko import CoinGeckoExtractor
-
         extractor = CoinGeckoExtractor()
 
         # Verify rate limit configuration
@@ -246,8 +319,6 @@ class TestRateLimitingBackoff:
 
     async def test_coinpaprika_exponential_backoff(self):
         """CoinPaprika extractor should implement exponential backoff."""
-        from app.ingestion.extractors.coinpaprika import CoinPaprikaExtractor
-
         extractor = CoinPaprikaExtractor()
 
         assert extractor.RATE_LIMIT_DELAY > 0
@@ -255,9 +326,6 @@ class TestRateLimitingBackoff:
 
     async def test_rate_limit_logging(self, caplog):
         """Rate limit events should be logged."""
-
-        from app.ingestion.extractors.coingecko import CoinGeckoExtractor
-
         # The extractor logs warnings on rate limit
         # This is verified by checking the extractor code has logging
         extractor = CoinGeckoExtractor()
@@ -276,6 +344,8 @@ class TestRateLimitingBackoff:
 class TestObservability:
     """Test observability features: metrics, logging, tracking."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_prometheus_metrics_format(self, async_client):
         """Metrics endpoint should return Prometheus format."""
         response = await async_client.get("/api/v1/metrics")
@@ -289,8 +359,6 @@ class TestObservability:
 
     async def test_metrics_tracks_http_requests(self, async_client):
         """Metrics should track HTTP request counts."""
-        from app.core.middleware import metrics_collector
-
         # Make some requests
         await async_client.get("/api/v1/health")
         await async_client.get("/api/v1/data")
@@ -302,8 +370,6 @@ class TestObservability:
 
     async def test_metrics_tracks_etl_runs(self):
         """Metrics should track ETL run counts."""
-        from app.core.middleware import metrics_collector
-
         # Simulate ETL runs
         metrics_collector.increment_etl_run("coingecko", "success")
         metrics_collector.increment_etl_run("coingecko", "failure")
@@ -316,8 +382,6 @@ class TestObservability:
 
     async def test_structured_json_logging(self):
         """Verify structured JSON logging is configured."""
-        from app.core.middleware import get_structured_logger
-
         logger = get_structured_logger("test")
         assert logger is not None
 
@@ -359,22 +423,21 @@ class TestObservability:
 class TestRunComparisonAnomalyDetection:
     """Test ETL run comparison and anomaly detection."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_runs_endpoint_returns_history(self, async_client, db_session):
         """GET /runs should return ETL run history."""
         # Create some ETL jobs
-        jobs = [
-            ETLJob(
+        await _bulk_add_jobs(db_session, [
+            dict(
                 source=DataSource.CSV,
                 status=ETLStatus.SUCCESS,
                 records_processed=100,
-                started_at=datetime(2024, 1, 15, i, 0, 0, tzinfo=timezone.utc),
-                completed_at=datetime(2024, 1, 15, i, 5, 0, tzinfo=timezone.utc),
+                started_at=start,
+                completed_at=end,
             )
-            for i in range(3)
-        ]
-        for job in jobs:
-            db_session.add(job)
-        await db_session.commit()
+            for start, end in _hourly_runs("2024-01-15", 3, timedelta(minutes=5))
+        ])
 
         response = await async_client.get("/api/v1/runs?limit=10")
         assert response.status_code == 200
@@ -391,27 +454,24 @@ class TestRunComparisonAnomalyDetection:
         outlier_duration = timedelta(minutes=60)  # 12x normal
 
         jobs = [
-            ETLJob(
+            dict(
                 source=DataSource.COINGECKO,
                 status=ETLStatus.SUCCESS,
                 records_processed=100,
-                started_at=datetime(2024, 1, 15, i, 0, 0, tzinfo=timezone.utc),
-                completed_at=datetime(2024, 1, 15, i, 0, 0, tzinfo=timezone.utc) + normal_duration,
+                started_at=start,
+                completed_at=end,
             )
-            for i in range(5)
+            for start, end in _hourly_runs("2024-01-15", 5, normal_duration)
         ]
         # Add outlier
-        jobs.append(ETLJob(
+        jobs.append(dict(
             source=DataSource.COINGECKO,
             status=ETLStatus.SUCCESS,
             records_processed=100,
             started_at=datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
             completed_at=datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc) + outlier_duration,
         ))
-
-        for job in jobs:
-            db_session.add(job)
-        await db_session.commit()
+        await _bulk_add_jobs(db_session, jobs)
 
         response = await async_client.get("/api/v1/runs?limit=10")
         data = response.json()
@@ -424,20 +484,20 @@ class TestRunComparisonAnomalyDetection:
     async def test_anomaly_detection_high_failure_rate(self, async_client, db_session):
         """Detect high failure rate anomaly."""
         # Create jobs with >30% failure rate
-        jobs = [
-            ETLJob(
+        await _bulk_add_jobs(db_session, [
+            dict(
                 source=DataSource.CSV,
                 status=ETLStatus.SUCCESS if i < 2 else ETLStatus.FAILURE,
                 records_processed=100 if i < 2 else 0,
-                started_at=datetime(2024, 1, 20, i, 0, 0, tzinfo=timezone.utc),
-                completed_at=datetime(2024, 1, 20, i, 5, 0, tzinfo=timezone.utc),
+                started_at=start,
+                completed_at=end,
                 error_message="Failed" if i >= 2 else None,
             )
-            for i in range(5)  # 2 success, 3 failure = 60% failure rate
-        ]
-        for job in jobs:
-            db_session.add(job)
-        await db_session.commit()
+            # 2 success, 3 failure = 60% failure rate
+            for i, (start, end) in enumerate(
+                _hourly_runs("2024-01-20", 5, timedelta(minutes=5))
+            )
+        ])
 
         response = await async_client.get("/api/v1/runs?limit=10")
         data = response.json()
@@ -448,28 +508,25 @@ class TestRunComparisonAnomalyDetection:
 
     async def test_compare_runs_endpoint(self, async_client, db_session):
         """GET /runs/compare should compare two runs."""
-        job1 = ETLJob(
-            source=DataSource.CSV,
-            status=ETLStatus.SUCCESS,
-            records_processed=100,
-            started_at=datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
-            completed_at=datetime(2024, 1, 15, 10, 5, 0, tzinfo=timezone.utc),
-        )
-        job2 = ETLJob(
-            source=DataSource.CSV,
-            status=ETLStatus.SUCCESS,
-            records_processed=150,  # 50 more records
-            started_at=datetime(2024, 1, 16, 10, 0, 0, tzinfo=timezone.utc),
-            completed_at=datetime(2024, 1, 16, 10, 6, 0, tzinfo=timezone.utc),
-        )
-        db_session.add(job1)
-        db_session.add(job2)
-        await db_session.commit()
-        await db_session.refresh(job1)
-        await db_session.refresh(job2)
+        id1, id2 = await _bulk_add_jobs(db_session, [
+            dict(
+                source=DataSource.CSV,
+                status=ETLStatus.SUCCESS,
+                records_processed=100,
+                started_at=datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
+                completed_at=datetime(2024, 1, 15, 10, 5, 0, tzinfo=timezone.utc),
+            ),
+            dict(
+                source=DataSource.CSV,
+                status=ETLStatus.SUCCESS,
+                records_processed=150,  # 50 more records
+                started_at=datetime(2024, 1, 16, 10, 0, 0, tzinfo=timezone.utc),
+                completed_at=datetime(2024, 1, 16, 10, 6, 0, tzinfo=timezone.utc),
+            ),
+        ])
 
         response = await async_client.get(
-            f"/api/v1/runs/compare?run_id_1={job1.id}&run_id_2={job2.id}"
+            f"/api/v1/runs/compare?run_id_1={id1}&run_id_2={id2}"
         )
         assert response.status_code == 200
 
@@ -482,19 +539,17 @@ class TestRunComparisonAnomalyDetection:
     async def test_statistics_calculation(self, async_client, db_session):
         """Run statistics should be calculated correctly."""
         # Create jobs with known values
-        jobs = [
-            ETLJob(
+        await _bulk_add_jobs(db_session, [
+            dict(
                 source=DataSource.CSV,
                 status=ETLStatus.SUCCESS,
                 records_processed=100,
-                started_at=datetime(2024, 1, 25, i, 0, 0, tzinfo=timezone.utc),
-                completed_at=datetime(2024, 1, 25, i, 5, 0, tzinfo=timezone.utc),  # 5 min each
+                started_at=start,
+                completed_at=end,
             )
-            for i in range(4)
-        ]
-        for job in jobs:
-            db_session.add(job)
-        await db_session.commit()
+            # 5 min each
+            for start, end in _hourly_runs("2024-01-25", 4, timedelta(minutes=5))
+        ])
 
         response = await async_client.get("/api/v1/runs?limit=10")
         data = response.json()
@@ -513,6 +568,8 @@ class TestRunComparisonAnomalyDetection:
 class TestP2Integration:
     """Integration tests for P2 features working together."""
 
+    pytestmark = pytest.mark.asyncio
+
     async def test_drift_detection_in_etl_pipeline(self):
         """Drift detection should integrate with ETL pipeline."""
         detector = DriftDetector(
@@ -521,10 +578,11 @@ class TestP2Integration:
 
         # Simulate API response with schema change
         df = pd.DataFrame({
-            "id": ["btc-bitcoin"],
-            "symbol": ["BTC"],
-            "name": ["Bitcoin"],
-            "quote": [{"USD": {"price": 50000}}],  # "quote" instead of "quotes"
+            "id": pd.array(["btc-bitcoin"], dtype="string"),
+            "symbol": pd.array(["BTC"], dtype="string"),
+            "name": pd.array(["Bitcoin"], dtype="string"),
+            # "quote" instead of "quotes"
+            "quote": pd.Series([{"USD": {"price": 50000}}], dtype=object),
         })
 
         has_critical, results = detector.detect_drift(df)
@@ -536,8 +594,6 @@ class TestP2Integration:
 
     async def test_observability_captures_failures(self, db_session):
         """Observability should capture failure details."""
-        from app.core.middleware import metrics_collector
-
         # Simulate failed ETL
         metrics_collector.increment_etl_run("coingecko", "failure")
 
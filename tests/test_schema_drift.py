@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import select
 
 from app.db.models import DataSource, RawData, UnifiedCryptoData
 from app.ingestion.extractors.coingecko import CoinGeckoExtractor
@@ -303,12 +304,19 @@ class TestDatabaseSchemaCompatibility:
         )
         db_session.add(minimal_record)
         await db_session.commit()
-        await db_session.refresh(minimal_record)
 
-        assert minimal_record.id is not None
-        assert minimal_record.symbol == "TEST"
-        assert minimal_record.market_cap is None
-        assert minimal_record.volume_24h is None
+        # Read back the persisted columns, not the in-memory attributes
+        stored = (await db_session.execute(
+            select(
+                UnifiedCryptoData.symbol,
+                UnifiedCryptoData.market_cap,
+                UnifiedCryptoData.volume_24h,
+            ).where(UnifiedCryptoData.id == minimal_record.id)
+        )).one()
+
+        assert stored.symbol == "TEST"
+        assert stored.market_cap is None
+        assert stored.volume_24h is None
 
     async def test_raw_data_stores_arbitrary_json(self, db_session):
         """Test that RawData can store arbitrary JSON payloads."""
@@ -364,8 +372,6 @@ class TestSchemaVersioning:
         await db_session.commit()
 
         # Both should coexist and be queryable
-        from sqlalchemy import select
-
         stmt = select(UnifiedCryptoData).where(
             UnifiedCryptoData.symbol.in_(["OLD", "NEW"])
         )
@@ -397,8 +403,10 @@ class TestDataValidation:
         db_session.add(invalid_record)
         await db_session.commit()
 
-        assert invalid_record.id is not None
-        assert invalid_record.price_usd == -100.0
+        stored_price = await db_session.scalar(
+            select(UnifiedCryptoData.price_usd).where(UnifiedCryptoData.id == invalid_record.id)
+        )
+        assert stored_price == -100.0
 
     async def test_symbol_validation_uppercase(self, db_session):
         """Symbols should be uppercase."""
@@ -411,8 +419,10 @@ class TestDataValidation:
         )
         db_session.add(record)
         await db_session.commit()
-        await db_session.refresh(record)
 
+        stored_symbol = await db_session.scalar(
+            select(UnifiedCryptoData.symbol).where(UnifiedCryptoData.id == record.id)
+        )
         # Either stored as-is or normalized to uppercase
         # Both are acceptable behaviors
-        assert record.symbol in ["btc", "BTC"]
+        assert stored_symbol in ["btc", "BTC"]
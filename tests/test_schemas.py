@@ -0,0 +1,212 @@
+"""Tests for API response schemas."""
+
+import dataclasses
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from app.core.middleware import request_time
+from app.db.models import DataSource
+from app.schemas.crypto import (
+    CryptoQueryParams,
+    DataResponse,
+    DBHealthStatus,
+    ETLHealthStatus,
+    HealthResponse,
+    Pagination,
+    ResponseMetadata,
+    UnifiedCryptoDataSchema,
+    next_request_id,
+)
+from app.schemas.crypto_out import (
+    DataResponseOut,
+    ResponseMetadataOut,
+    UnifiedCryptoDataOut,
+    encode,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _make_row(**overrides):
+    """Build an object shaped like a UnifiedCryptoData ORM row."""
+    row = {
+        "id": 1,
+        "coin_id": 7,
+        "symbol": "BTC",
+        "price_usd": Decimal("45000.12345678"),
+        "market_cap": Decimal("880000000000"),
+        "volume_24h": None,
+        "source": DataSource.COINGECKO,
+        "ingested_at": datetime(2024, 1, 15, 10, 31, tzinfo=timezone.utc),
+        "timestamp": datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestUnifiedCryptoDataSchema:
+    """Test trusted ORM hydration of unified crypto data."""
+
+    def test_from_orm_trusted_matches_model_validate(self):
+        row = _make_row()
+
+        trusted = UnifiedCryptoDataSchema.from_orm_trusted(row)
+        validated = UnifiedCryptoDataSchema.model_validate(row)
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json() == validated.model_dump_json()
+
+    def test_from_orm_trusted_coerces_numeric_columns(self):
+        trusted = UnifiedCryptoDataSchema.from_orm_trusted(_make_row())
+
+        assert isinstance(trusted.price_usd, float)
+        assert isinstance(trusted.market_cap, float)
+        assert trusted.volume_24h is None
+
+    def test_from_orm_trusted_marks_all_fields_set(self):
+        trusted = UnifiedCryptoDataSchema.from_orm_trusted(_make_row(coin_id=None))
+
+        assert trusted.model_fields_set == set(UnifiedCryptoDataSchema.model_fields)
+
+    def test_rows_are_frozen_and_slotted(self):
+        trusted = UnifiedCryptoDataSchema.from_orm_trusted(_make_row())
+
+        with pytest.raises(ValidationError):
+            trusted.symbol = "ETH"
+        assert not hasattr(trusted, "__weakref__")
+
+
+class TestUnifiedCryptoDataOut:
+    """Test msgspec output structs stay in step with the Pydantic schemas."""
+
+    def test_encoded_row_matches_pydantic_json(self):
+        row = _make_row()
+
+        fast = json.loads(encode(UnifiedCryptoDataOut.from_orm(row)))
+        slow = json.loads(UnifiedCryptoDataSchema.model_validate(row).model_dump_json())
+
+        assert fast == slow
+
+    def test_data_response_bytes_match_pydantic_path(self):
+        """/data serializes to identical JSON bytes with or without fast_serialization."""
+        rows = [_make_row(), _make_row(id=2, coin_id=None, price_usd=None)]
+        pagination = Pagination(limit=50, offset=0, total=2)
+
+        fast = encode(DataResponseOut(
+            metadata=ResponseMetadataOut(
+                total_records=2, api_latency_ms=1.25, request_id="req-1"
+            ),
+            data=[UnifiedCryptoDataOut.from_orm(row) for row in rows],
+            pagination=pagination,
+        ))
+        slow = orjson.dumps(DataResponse(
+            metadata=ResponseMetadata(total_records=2, api_latency_ms=1.25, request_id="req-1"),
+            data=[UnifiedCryptoDataSchema.from_orm_trusted(row) for row in rows],
+            pagination=pagination,
+        ).model_dump(mode="json"))
+
+        assert fast == slow
+
+
+class TestRequestIds:
+    """Test pooled request id generation."""
+
+    def test_next_request_id_is_uuid4(self):
+        parsed = uuid.UUID(next_request_id())
+
+        assert parsed.version == 4
+
+    def test_next_request_id_is_unique_across_refills(self):
+        ids = {next_request_id() for _ in range(3000)}
+
+        assert len(ids) == 3000
+
+    def test_response_metadata_default_request_id(self):
+        metadata = ResponseMetadata(total_records=0, api_latency_ms=0.0)
+
+        assert uuid.UUID(metadata.request_id).version == 4
+
+
+class TestHealthSchemas:
+    """Test dataclass-based health and metadata schemas."""
+
+    def test_health_response_serializes_dataclass_parts(self):
+        response = HealthResponse(
+            status="healthy",
+            database=DBHealthStatus(connected=True, latency_ms=1.5),
+            etl=ETLHealthStatus(last_run_source=DataSource.CSV),
+            metadata=ResponseMetadata(total_records=0, api_latency_ms=2.0),
+        )
+
+        dumped = response.model_dump(mode="json")
+
+        assert dumped["database"] == {"connected": True, "latency_ms": 1.5, "error": None}
+        assert dumped["etl"]["last_run_source"] == "csv"
+        assert set(dumped["metadata"]) == {"request_id", "total_records", "api_latency_ms"}
+
+    def test_health_timestamp_defaults_to_request_time(self):
+        started = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        token = request_time.set(started)
+        try:
+            response = HealthResponse(
+                status="healthy",
+                database=DBHealthStatus(connected=True, latency_ms=1.5),
+                etl=ETLHealthStatus(),
+            )
+        finally:
+            request_time.reset(token)
+
+        assert response.timestamp == started
+
+    def test_health_parts_are_frozen(self):
+        status = DBHealthStatus(connected=True, latency_ms=1.5)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            status.connected = False
+
+
+class TestCryptoQueryParams:
+    """Test single-pass query parameter parsing."""
+
+    def test_defaults(self):
+        params = CryptoQueryParams.from_request({})
+
+        assert params == CryptoQueryParams()
+        assert params.page == 1
+        assert params.page_size == 50
+
+    def test_parses_all_fields(self):
+        params = CryptoQueryParams.from_request({
+            "symbol": "BTC",
+            "source": "coingecko",
+            "start_date": "2024-01-01T00:00:00+00:00",
+            "end_date": "2024-01-31",
+            "page": "3",
+            "page_size": "25",
+        })
+
+        assert params.symbol == "BTC"
+        assert params.source is DataSource.COINGECKO
+        assert params.start_date == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert params.end_date == datetime(2024, 1, 31)
+        assert (params.page, params.page_size) == (3, 25)
+
+    @pytest.mark.parametrize(
+        "query", [{"page": "0"}, {"page_size": "500"}, {"page_size": "0"}],
+        ids=["page_0", "page_size_500", "page_size_0"],
+    )
+    def test_out_of_range_paging_raises(self, query):
+        with pytest.raises(ValueError):
+            CryptoQueryParams.from_request(query)
+
+    def test_invalid_source_raises(self):
+        with pytest.raises(ValueError):
+            CryptoQueryParams.from_request({"source": "binance"})